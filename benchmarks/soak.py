@@ -0,0 +1,209 @@
+"""Soak test of BlackjackApp: memory use over many rounds, traced with tracemalloc.
+
+Plays rounds through the app headlessly with random legal moves, and samples
+the memory still held after every `--interval` rounds. Exits with status 1 if
+the retained memory keeps growing by more than `--max-growth` bytes per
+round after the warm up. Run from the repository root:
+
+    python benchmarks/soak.py
+
+Under tracemalloc a round takes about 0.65 s, so the default 3000 rounds take
+around 35 minutes. A healthy run measured 60 B/round of growth after the warm
+up, mostly in Textual's and Rich's bounded render caches, and the default
+limit leaves four times that. Leaking as little as a hand per round exceeds it.
+"""
+
+import argparse
+import asyncio
+import gc
+import random
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path[:0] = [str(ROOT / "src"), str(ROOT)]
+
+from textual.widgets import Button, Input  # noqa: E402
+
+from app import STRATEGY, BlackjackApp  # noqa: E402
+from settlement import stake  # noqa: E402
+from states import UPCARDS, all_states, encode  # noqa: E402
+
+BUY_IN = 10000
+BET = 10
+MOVE_WEIGHTS = {"hit": 6, "stand": 6, "double": 2, "split": 4, "surrender": 1}
+
+
+@dataclass
+class Sample:
+    round: int
+    retained: int  # bytes
+    blocks: int
+
+
+@dataclass
+class Soak:
+    samples: list[Sample] = field(default_factory=list)
+    # Kept as running totals, so that the soak itself retains nothing per round
+    transient: int = 0  # bytes allocated and released within rounds
+    transient_max: int = 0
+    blocks: int = 0  # allocations still held at the end of rounds, summed
+    blocks_max: int = 0
+    peak: int = 0
+    snapshots: list[tracemalloc.Snapshot] = field(default_factory=list)
+
+
+def slope(samples: list[Sample]) -> float:
+    """Least squares growth of the retained memory, in bytes per round."""
+    rounds = [sample.round for sample in samples]
+    retained = [sample.retained for sample in samples]
+    mean_x = sum(rounds) / len(rounds)
+    mean_y = sum(retained) / len(retained)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in zip(rounds, retained))
+    variance = sum((x - mean_x) ** 2 for x in rounds)
+    return covariance / variance if variance else 0.0
+
+
+async def play_round(app: BlackjackApp, rnd: random.Random) -> None:
+    app.action_play("deal")
+    await app.actions.join()
+    while app.buttons["deal"].disabled:
+        moves = [move for move in MOVE_WEIGHTS if not app.buttons[move].disabled]
+        app.action_play(rnd.choices(moves, [MOVE_WEIGHTS[m] for m in moves])[0])
+        await app.actions.join()
+
+
+def warm_caches() -> None:
+    """Fills the strategy's move caches, which are bounded but fill slowly.
+
+    Left to fill during the soak, rarely seen hands keep adding entries long
+    after the warm up, and pass for growth.
+    """
+    singles = [encode(11, soft=True, cards=1)]  # A hand left with one card
+    singles += [encode(value, cards=1) for value in range(2, 11)]
+    for code in (*all_states(), *singles):
+        for upcard in UPCARDS:
+            STRATEGY.get_move(code, upcard)
+            STRATEGY.next_moves(code, upcard, True)
+            STRATEGY.next_moves(code, upcard, False)
+
+
+def sample(soak: Soak, done: int) -> None:
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    soak.samples.append(Sample(done, retained, sys.getallocatedblocks()))
+
+
+async def soak_app(args: argparse.Namespace) -> Soak:
+    rnd = random.Random(args.seed)
+    random.seed(args.seed)
+    soak = Soak()
+
+    app = BlackjackApp()
+    async with app.run_test(size=(args.width, args.height)) as pilot:
+        app.query_one("#buy_in", Input).value = str(BUY_IN)
+        app.query_one("#num_decks", Input).value = str(args.decks)
+        app.query_one("#start_game", Button).press()
+        app.query_one("#bet", Input).value = str(BET)
+        await app.reveal(".location-stats")
+        await pilot.pause()
+
+        warm_caches()
+        tracemalloc.start(args.frames)
+        for done in range(1, args.rounds + 1):
+            if app.balance < stake(BET) * 8:
+                app.balance = stake(BUY_IN)  # Rebuy, so play never stops
+
+            start, _ = tracemalloc.get_traced_memory()
+            blocks = sys.getallocatedblocks()
+            tracemalloc.reset_peak()
+            await play_round(app, rnd)
+            await asyncio.sleep(0)  # Let the screen catch up
+            transient = tracemalloc.get_traced_memory()[1] - start
+            soak.transient += transient
+            soak.transient_max = max(soak.transient_max, transient)
+            blocks = sys.getallocatedblocks() - blocks
+            soak.blocks += blocks
+            soak.blocks_max = max(soak.blocks_max, blocks)
+
+            if done == args.warmup or (
+                done > args.warmup and (done - args.warmup) % args.interval == 0
+            ):
+                await pilot.pause()
+                sample(soak, done)
+                if not soak.snapshots or done == args.rounds:
+                    soak.snapshots.append(tracemalloc.take_snapshot())
+            if not args.quiet and done % 100 == 0:
+                print(f"\r{done}/{args.rounds} rounds", end="", file=sys.stderr)
+
+        if soak.samples[-1].round != args.rounds:
+            sample(soak, args.rounds)
+            soak.snapshots.append(tracemalloc.take_snapshot())
+        _, soak.peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    if not args.quiet:
+        print(file=sys.stderr)
+    return soak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=3000)
+    parser.add_argument("--warmup", type=int, default=1000, help="rounds not judged")
+    parser.add_argument("--interval", type=int, default=250, help="rounds per sample")
+    parser.add_argument(
+        "--max-growth",
+        type=float,
+        default=256,
+        help="retained bytes per round allowed after the warm up",
+    )
+    parser.add_argument("--decks", type=int, default=6)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--frames", type=int, default=1, help="traceback depth")
+    parser.add_argument("--top", type=int, default=10, help="growth sites to list")
+    parser.add_argument("--width", type=int, default=120)
+    parser.add_argument("--height", type=int, default=40)
+    parser.add_argument("--quiet", "-q", action="store_true", help="hide progress")
+    args = parser.parse_args()
+    if args.rounds <= args.warmup:
+        parser.error("--rounds must be more than --warmup")
+
+    start = time.perf_counter()
+    soak = asyncio.run(soak_app(args))
+    elapsed = time.perf_counter() - start
+
+    first, last = soak.samples[0], soak.samples[-1]
+    growth = slope(soak.samples)
+    print(f"rounds:          {args.rounds} in {elapsed:.1f} s")
+    print(f"peak:            {soak.peak / 1024:.1f} KiB")
+    print(
+        f"transient/round: {soak.transient / args.rounds:.0f} B "
+        f"(max {soak.transient_max} B)"
+    )
+    print(
+        f"blocks/round:    {soak.blocks / args.rounds:+.1f} "
+        f"(max {soak.blocks_max:+d}, before garbage collection)"
+    )
+    print(f"retained:        {first.retained / 1024:.1f} KiB at round {first.round}")
+    print(f"                 {last.retained / 1024:.1f} KiB at round {last.round}")
+    print(f"blocks:          {first.blocks} -> {last.blocks}")
+    print(f"growth:          {growth:.1f} B/round (limit {args.max_growth:g})")
+    for item in soak.samples:
+        print(f"  {item.round:>7} {item.retained / 1024:>10.1f} KiB {item.blocks:>9}")
+
+    stats = soak.snapshots[-1].compare_to(soak.snapshots[0], "lineno")
+    print(f"top growth since round {first.round}:")
+    for stat in stats[: args.top]:
+        print(f"  {stat}")
+
+    if growth > args.max_growth:
+        print("FAIL: retained memory grows with every round")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Time to first frame of BlackjackApp, measured in Textual's headless mode.
+
+The pages left out of the first frame are built right after it, and the time
+that takes is reported separately. Run from the repository root:
+
+    python benchmarks/startup.py --runs 20
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path[:0] = [str(ROOT / "src"), str(ROOT)]
+
+from app import BlackjackApp  # noqa: E402
+
+
+class TimedApp(BlackjackApp):
+    first_frame = 0.0
+    pages_built = 0.0
+
+    def on_mount(self) -> None:
+        # Textual runs this before BlackjackApp.on_mount, so the hook is queued
+        # ahead of the page build
+        self.call_after_refresh(self.mark_first_frame)
+
+    def mark_first_frame(self) -> None:
+        self.first_frame = time.perf_counter()
+
+    async def build_pages(self) -> None:
+        await super().build_pages()
+        self.pages_built = time.perf_counter()
+
+
+async def first_frame(size: tuple[int, int]) -> tuple[float, float]:
+    """Seconds from creating the app to its first frame, and to its pages built."""
+    start = time.perf_counter()
+    app = TimedApp()
+    async with app.run_test(size=size) as pilot:
+        await pilot.pause()
+    return app.first_frame - start, app.pages_built - app.first_frame
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--width", type=int, default=120)
+    parser.add_argument("--height", type=int, default=40)
+    args = parser.parse_args()
+
+    size = (args.width, args.height)
+    asyncio.run(first_frame(size))  # Warm up imports and caches
+    runs = [asyncio.run(first_frame(size)) for _ in range(args.runs)]
+
+    print(f"runs:   {args.runs}")
+    for name, timings in zip(["first frame", "page build"], zip(*runs)):
+        timings = [timing * 1000 for timing in timings]
+        print(f"{name}:")
+        print(f"  mean:   {statistics.mean(timings):.1f} ms")
+        print(f"  median: {statistics.median(timings):.1f} ms")
+        print(f"  min:    {min(timings):.1f} ms")
+        print(f"  max:    {max(timings):.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,17 @@
 import asyncio
+from functools import cache, partial
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 from rich.markdown import Markdown
 from rich.text import Text
 from textual import on
 from textual.app import App, ComposeResult
+from textual.binding import Binding
 from textual.containers import Container, Horizontal, ScrollableContainer
 from textual.reactive import reactive, var
 from textual.validation import Function, Number
+from textual.widget import AwaitMount, Widget
 from textual.widgets import (
     Button,
     DataTable,
@@ -21,7 +24,7 @@ from textual.widgets import (
     Static,
 )
 
-from card import Shoot
+from card import Card, Shoot
 from classes import (
     AboveFold,
     Body,
@@ -32,12 +35,78 @@ from classes import (
     SubTitle,
     TextContent,
 )
-from enums import HandState
-from hand import Hand, HandDisplay
-from src.app_text import RULES, STRATEGY_INTRO, WELCOME
+from enums import HandState, StrategyMove
+from hand import Hand, HandPool
+from hand_display import HandDisplay
+from rules import TableRules
+from settlement import Outcome, format_cents, outcome, payout, stake
+from side_bets import side_bet_evs
+from src.app_text import RULES, STATS_INTRO, STRATEGY_INTRO, TRAINER_INTRO, WELCOME
+from states import UPCARD_LABELS, UPCARDS, next_state
+from stats import Stats
 from strategy import Strategy
+from trainer import TrainerDisplay
 
 STRATEGY = Strategy()
+TABLE_RULES = TableRules()
+
+# Game actions, named after the buttons that perform them.
+ACTIONS = ("deal", "hit", "stand", "double", "split", "surrender")
+
+MOVE_STYLES = {
+    "H": "bold",
+    "S": "bold yellow",
+    "D": "bold green",
+    "Ds": "bold green",
+    "Y": "bold green",
+    "N": "bold red",
+    "SUR": "bold red",
+}
+
+LEGEND = [
+    ("H", "Hit"),
+    ("S", "Stand"),
+    ("D", "Double"),
+    ("Ds", "Double if allowed, otherwise Stand"),
+    ("Y", "Split"),
+    ("N", "Don't Split"),
+    ("SUR", "Surrender"),
+]
+
+
+@cache
+def strategy_rows(chart: str) -> list[list[Text]]:
+    """Styled rows of a strategy chart, built once and reused."""
+    if chart == "surrender_table":
+        return [
+            [Text("16"), *[Text("SUR", style=MOVE_STYLES["SUR"])] * 3],
+            [Text("15"), Text(""), Text("SUR", style=MOVE_STYLES["SUR"]), Text("")],
+        ]
+
+    lookup = {
+        "hard-totals": STRATEGY.hard_totals,
+        "soft-totals": STRATEGY.soft_totals,
+        "splits_table": STRATEGY.splits,
+    }
+    return [
+        [Text(cell, style=MOVE_STYLES.get(cell, "")) for cell in row]
+        for row in lookup[chart].rows()
+    ]
+
+
+class LazyColumn(Column):
+    """A page whose contents are built after the first frame, or when visited."""
+
+    def __init__(self, build: Callable[[], Widget], **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.build = build
+        self.mounting: AwaitMount | None = None
+
+    async def ensure_built(self) -> None:
+        # Waits for a build already under way, rather than starting another
+        if self.mounting is None:
+            self.mounting = self.mount(self.build())
+        await self.mounting
 
 
 class LocationLink(Static):
@@ -45,8 +114,8 @@ class LocationLink(Static):
         super().__init__(label)
         self.reveal = reveal
 
-    def on_click(self) -> None:
-        self.app.query_one(self.reveal).scroll_visible(top=True, duration=0.5)
+    async def on_click(self) -> None:
+        await self.app.reveal(self.reveal)
 
 
 class Welcome(Container):
@@ -54,8 +123,98 @@ class Welcome(Container):
         yield Static(Markdown(WELCOME))
         yield Button("Start", variant="success")
 
-    def on_button_pressed(self, event: Button.Pressed) -> None:
-        self.app.query_one(".location-rules").scroll_visible(duration=0.5, top=True)
+    async def on_button_pressed(self, event: Button.Pressed) -> None:
+        await self.app.reveal(".location-rules")
+
+
+class StrategySection(Section):
+    def compose(self) -> ComposeResult:
+        yield SectionTitle("Strategy")
+        yield DataTable(id="strategy-legend")
+        yield TextContent(Markdown(STRATEGY_INTRO))
+        yield TextContent(Text("Hard Totals", style="bold"))
+        yield DataTable(id="hard-totals")
+        yield TextContent(Text("Soft Totals", style="bold"))
+        yield DataTable(id="soft-totals")
+        yield TextContent(Text("Splits", style="bold"))
+        yield DataTable(id="splits_table")
+        yield TextContent(Text("Surrender", style="bold"))
+        yield DataTable(id="surrender_table")
+        yield TextContent(
+            Markdown("#### Insurance or even money is never recommended.")
+        )
+
+    def on_mount(self) -> None:
+        columns = {
+            "hard-totals": ["Hand", *STRATEGY.hard_totals.columns],
+            "soft-totals": ["Hand", *STRATEGY.soft_totals.columns],
+            "splits_table": ["Hand", *STRATEGY.splits.columns],
+            "surrender_table": ["Hand", "9", "10", "A"],
+        }
+        for chart, headers in columns.items():
+            table = self.query_one(f"#{chart}", expect_type=DataTable)
+            table.add_columns(*headers)
+            table.add_rows(strategy_rows(chart))
+
+        table = self.query_one("#strategy-legend", expect_type=DataTable)
+        table.add_columns("Strategy", "Description")
+        table.add_rows(
+            (Text(move, style=MOVE_STYLES[move]), description)
+            for move, description in LEGEND
+        )
+
+
+class StatsSection(Section):
+    def __init__(self, stats: Stats, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.stats = stats
+
+    def compose(self) -> ComposeResult:
+        yield SectionTitle("Stats")
+        yield TextContent(Markdown(STATS_INTRO))
+        yield TextContent(id="stats_summary")
+        yield TextContent(Text("Outcome by Count", style="bold"))
+        yield DataTable(id="stats_by_count")
+
+    def on_mount(self) -> None:
+        table = self.query_one("#stats_by_count", expect_type=DataTable)
+        table.add_columns("Count", "Hands", "Win", "Push", "Loss", "Net")
+        self.update_stats()
+
+    def summary(self) -> Text:
+        stats = self.stats
+        totals = stats.totals
+        return Text(
+            "\n".join(
+                [
+                    f"Hands played: {totals.hands}",
+                    f"Win: {totals.rate(totals.wins):.1%}  "
+                    f"Push: {totals.rate(totals.pushes):.1%}  "
+                    f"Loss: {totals.rate(totals.losses):.1%}",
+                    f"Net result: {format_cents(totals.net)} "
+                    f"(expected {format_cents(stats.expected_net)})",
+                    f"EV: {stats.ev:.2%} of wagered",
+                    f"Strategy adherence: {stats.adherence:.1%} "
+                    f"of {stats.decisions} decisions",
+                ]
+            )
+        )
+
+    def update_stats(self) -> None:
+        self.query_one("#stats_summary", expect_type=TextContent).update(self.summary())
+
+        table = self.query_one("#stats_by_count", expect_type=DataTable)
+        table.clear()
+        for count in sorted(self.stats.by_count):
+            outcomes = self.stats.by_count[count]
+            table.add_row(
+                str(count),
+                str(outcomes.hands),
+                f"{outcomes.rate(outcomes.wins):.1%}",
+                f"{outcomes.rate(outcomes.pushes):.1%}",
+                f"{outcomes.rate(outcomes.losses):.1%}",
+                format_cents(outcomes.net),
+            )
 
 
 class BlackjackApp(App):
@@ -63,6 +222,13 @@ class BlackjackApp(App):
     SUB_TITLE = "© Aryan Jain"
     BINDINGS = [
         ("ctrl+t", "toggle_dark", "Toggle dark mode"),
+        # Priority bindings, so they also work while the bet input has focus
+        Binding("space", "play('deal')", "Deal", priority=True),
+        Binding("h", "play('hit')", "Hit", priority=True),
+        Binding("s", "play('stand')", "Stand", priority=True),
+        Binding("d", "play('double')", "Double", priority=True),
+        Binding("p", "play('split')", "Split", priority=True),
+        Binding("r", "play('surrender')", "Surrender", priority=True),
     ]
     CSS_PATH = Path(__file__).parent / "css/style.tcss"
 
@@ -76,7 +242,20 @@ class BlackjackApp(App):
     count = reactive(0)
     cards_remaining = reactive(0)
 
-    recommended_strategy = reactive("")
+    recommended_strategy = reactive("", init=False)
+    side_bets = reactive("")
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.stats = Stats()
+        self.round_count = 0
+        self.shoot: Shoot | None = None
+        self.actions: asyncio.Queue[str] = asyncio.Queue()
+        self.dealer_hand = Hand(dealer=True)
+        self.pool = HandPool(TABLE_RULES.max_hands)
+        self.hand_displays = [
+            HandDisplay(hand=hand, classes="inactive") for hand in self.pool.hands
+        ]
 
     def compose(self) -> ComposeResult:
         yield Container(
@@ -86,33 +265,25 @@ class BlackjackApp(App):
                     LocationLink("Home", ".location-top"),
                     LocationLink("Rules", ".location-rules"),
                     LocationLink("Strategy", ".location-strategy"),
+                    LocationLink("Trainer", ".location-trainer"),
                     LocationLink("Play", ".location-play"),
+                    LocationLink("Stats", ".location-stats"),
                 ),
                 AboveFold(Welcome(), classes="location-top"),
-                Column(
-                    Section(SectionTitle("Rules"), TextContent(Markdown(RULES))),
+                LazyColumn(
+                    lambda: Section(
+                        SectionTitle("Rules"), TextContent(Markdown(RULES))
+                    ),
                     classes="location-rules",
                 ),
-                Column(
-                    Section(
-                        SectionTitle("Strategy"),
-                        DataTable(id="strategy-legend"),
-                        TextContent(Markdown(STRATEGY_INTRO)),
-                        TextContent(Text("Hard Totals", style="bold")),
-                        DataTable(id="hard-totals"),
-                        TextContent(Text("Soft Totals", style="bold")),
-                        DataTable(id="soft-totals"),
-                        TextContent(Text("Splits", style="bold")),
-                        DataTable(id="splits_table"),
-                        TextContent(Text("Surrender", style="bold")),
-                        DataTable(id="surrender_table"),  # type: ignore
-                        TextContent(
-                            Markdown(
-                                "#### Insurance or even money is never recommended."
-                            )
-                        ),
+                LazyColumn(StrategySection, classes="location-strategy"),
+                LazyColumn(
+                    lambda: Section(
+                        SectionTitle("Trainer"),
+                        TextContent(Markdown(TRAINER_INTRO)),
+                        TrainerDisplay(STRATEGY),
                     ),
-                    classes="location-strategy",
+                    classes="location-trainer",
                 ),
                 Column(
                     Section(
@@ -143,13 +314,18 @@ class BlackjackApp(App):
                             id="cards_remaining",
                         ),
                         TextContent(Text(f"Count: {self.count}"), id="count_display"),
+                        TextContent(Text(self.side_bets), id="side_bets_display"),
                         SubTitle("Dealer"),
                         SubTitle(self.dealer_str, id="dealer_str_display"),
                         SubTitle(
                             f"Total: {self.dealer_total}", id="dealer_total_display"
                         ),
                         Rule(),
-                        ScrollableContainer(id="player_hands", classes="player_hands"),
+                        ScrollableContainer(
+                            *self.hand_displays,
+                            id="player_hands",
+                            classes="player_hands",
+                        ),
                         Horizontal(
                             Button("Hit", id="hit", variant="primary", disabled=True),
                             Button(
@@ -175,6 +351,7 @@ class BlackjackApp(App):
                             ),
                             id="strategy_recommendation",
                         ),
+                        TextContent(Text(""), id="next_recommendations"),
                         TextContent(f"Balance: {self.player_balance}", id="balance"),
                         Label("Bet: "),
                         Input(
@@ -193,15 +370,31 @@ class BlackjackApp(App):
                     ),
                     classes="location-game",
                 ),
+                LazyColumn(lambda: StatsSection(self.stats), classes="location-stats"),
             ),
         )
         yield Footer()
 
+    def on_mount(self) -> None:
+        # Looked up once, as querying the whole DOM on every move is slow
+        self.buttons = {
+            action: self.query_one(f"#{action}", Button) for action in ACTIONS
+        }
+        self.recommendation = self.query_one("#strategy_recommendation", TextContent)
+        self.next_recommendations = self.query_one("#next_recommendations", TextContent)
+        self.run_worker(self.process_actions(), group="actions")
+        self.call_after_refresh(self.build_pages)
+
+    async def build_pages(self) -> None:
+        """Builds the pages left out of the first frame, so scrolling reaches them."""
+        for column in self.query(LazyColumn):
+            await column.ensure_built()
+
     def is_valid_bet(self, bet: str) -> bool:
         try:
             return (
                 int(bet) >= 10
-                and int(bet) <= int(self.balance / 100)
+                and stake(int(bet)) <= self.balance
                 and (int(bet) % 10 == 0)
             )
         except ValueError:
@@ -212,32 +405,79 @@ class BlackjackApp(App):
             case "start_game":
                 event.button.disabled = True
                 buy_in = self.query_one("#buy_in", expect_type=Input).value
-                self.balance = int(buy_in) * 100
-                self.player_balance = f"${self.balance / 100:.2f}"
+                self.balance = stake(int(buy_in))
+                self.player_balance = format_cents(self.balance)
 
                 self.num_decks = self.query_one("#num_decks", expect_type=Input)
                 self.shoot = Shoot(decks=int(self.num_decks.value))
                 self.cards_remaining = len(self.shoot.cards) - self.shoot.reshuffle
+                self.update_side_bets()
 
                 self.app.query_one(".location-game").scroll_visible(
                     duration=0.5, top=True
                 )
 
+            case action if action in ACTIONS:
+                self.actions.put_nowait(action)
+
+    def action_play(self, action: str) -> None:
+        if self.trainer_in_view():
+            # The keys answer the drill on screen, not the game below it
+            for trainer in self.query(TrainerDisplay):
+                trainer.play(action)
+        else:
+            self.actions.put_nowait(action)
+
+    def trainer_in_view(self) -> bool:
+        """Whether the Trainer is the page on screen, or being scrolled there."""
+        body = self.query_one(Body)
+        middle = body.scroll_target_y + body.size.height // 2
+        page = self.query_one(".location-trainer").virtual_region
+        return page.y <= middle < page.bottom
+
+    async def process_actions(self) -> None:
+        """Performs queued actions one at a time, in the order they came in.
+
+        Keys pressed while an action is still updating the screen wait here
+        instead of being dropped, and are only checked against the buttons
+        once it's their turn.
+        """
+        while True:
+            action = await self.actions.get()
+            try:
+                if self.can_perform(action):
+                    await self.perform(action)
+            finally:
+                self.actions.task_done()
+
+    def can_perform(self, action: str) -> bool:
+        if self.buttons[action].disabled:
+            return False
+        if action == "deal":
+            bet = self.query_one("#bet", expect_type=Input).value
+            return self.shoot is not None and self.is_valid_bet(bet)
+        return True
+
+    async def perform(self, action: str) -> None:
+        match action:
             case "deal":
-                self.query_one("#deal", Button).disabled = True
-                while hands := self.query(HandDisplay):
-                    hands.last().remove()
+                self.buttons["deal"].disabled = True
+                for display in self.hand_displays:
+                    display.display = False
+                self.pool.reset()
                 self.hand_idx = 0
-                hand = Hand()
-                self.active_hand = HandDisplay(hand=hand)
-                self.active_hand.add_class("active")
-                await self.query_one("#player_hands").mount(self.active_hand)
+                self.round_count = self.shoot.count
 
-                hand.bet = int(self.query_one("#bet", expect_type=Input).value)
-                self.balance -= hand.bet * 100
-                self.player_balance = f"${self.balance / 100:.2f}"
+                bet = int(self.query_one("#bet", expect_type=Input).value)
+                self.active_hand = self.take_hand(bet)
+                self.active_hand.remove_class("inactive")
+                self.active_hand.add_class("active")
+                hand = self.active_hand.hand
+                self.balance -= stake(hand.bet)
+                self.player_balance = format_cents(self.balance)
 
-                self.dealer_hand = Hand(dealer=True)
+                self.dealer_hand.reset()
+                self.dealer_hand.dealer = True
 
                 for _ in range(2):
                     await self.draw_card()
@@ -245,68 +485,90 @@ class BlackjackApp(App):
 
                 self.dealer_str = str(self.dealer_hand)
 
-                _, player_total = hand.get_total()
-                if player_total == 21:
+                if hand.is_blackjack():
                     hand.state = HandState.BLACKJACK
-                else:
-                    self.query_one("#hit").disabled = False
-                    self.query_one("#surrender").disabled = False
-
-                    if self.balance >= hand.bet * 100:
-                        self.query_one("#double").disabled = False
-
-                        card1, card2 = hand.cards
-                        if min(card1.rank.value, 10) == min(card2.rank.value, 10):
-                            self.query_one("#split").disabled = False
-
-                self.query_one("#stand").disabled = False
+                self.update_buttons()
 
-                self.recommended_strategy = STRATEGY.get_strategy(
-                    hand, self.dealer_hand
-                ).name
-
-                _, dealer_total = self.dealer_hand.get_total()
-                if dealer_total == 21:
+                if self.dealer_hand.state == HandState.BLACKJACK:
                     self.dealer_total = "Blackjack :("
                     self.dealer_hand.state = HandState.BLACKJACK
                     await self.stand()
 
             case "hit":
+                self.record_decision(StrategyMove.HIT)
                 await self.hit()
                 if self.active_hand.hand.state == HandState.BUST:
                     await self.stand()
 
             case "stand":
+                self.record_decision(StrategyMove.STAND)
                 await self.stand()
 
             case "double":
-                self.balance -= self.active_hand.hand.bet * 100
+                self.record_decision(StrategyMove.DOUBLE)
+                self.balance -= stake(self.active_hand.hand.bet)
                 self.active_hand.hand.bet *= 2
-                self.player_balance = f"${self.balance / 100:.2f}"
+                self.player_balance = format_cents(self.balance)
                 await self.hit()
                 await self.stand()
 
             case "surrender":
+                self.record_decision(StrategyMove.SURRENDER)
                 await self.surrender()
 
             case "split":
+                self.record_decision(StrategyMove.SPLIT)
                 await self.split()
 
-    async def hit(self):
-        hand = self.active_hand.hand
+    def record_decision(self, move: StrategyMove) -> None:
+        if self.buttons["hit"].disabled:
+            return  # Only standing is possible, nothing to decide
 
-        await self.draw_card()
-        self.query_one("#double").disabled = True
-        self.query_one("#split").disabled = True
+        self.stats.record_decision(
+            move,
+            STRATEGY.get_strategy(
+                self.active_hand.hand,
+                self.dealer_hand,
+                allow_split=self.can_split(self.active_hand.hand),
+            ),
+            can_double=not self.buttons["double"].disabled,
+            can_surrender=not self.buttons["surrender"].disabled,
+        )
 
-        total1, total11 = hand.get_total()
-        if total1 >= 21 or total11 == 21:
-            self.query_one("#hit").disabled = True
-            self.query_one("#surrender").disabled = True
+    def take_hand(self, bet: int) -> HandDisplay:
+        self.pool.take(bet)
+        display = self.hand_displays[len(self.pool) - 1]
+        display.reset()
+        return display
 
-        self.recommended_strategy = STRATEGY.get_strategy(hand, self.dealer_hand).name
+    def can_split(self, hand: Hand) -> bool:
+        """Whether `hand` may be split now, which the Split button shows."""
+        return self.balance >= stake(hand.bet) and TABLE_RULES.can_split(
+            hand, len(self.pool)
+        )
 
-        await self.active_hand.update()
+    def can_split_next(self, hand: Hand) -> bool:
+        """Whether `hand` may be split if the next card makes it a pair."""
+        if len(hand.cards) != 1:
+            return False
+        pair = Hand(cards=hand.cards * 2, bet=hand.bet, split=hand.split)
+        return self.can_split(pair)
+
+    def update_buttons(self) -> None:
+        hand = self.active_hand.hand
+        can_afford = self.balance >= stake(hand.bet)
+
+        self.buttons["hit"].disabled = not TABLE_RULES.can_hit(hand)
+        self.buttons["stand"].disabled = False
+        self.buttons["double"].disabled = not (
+            can_afford and TABLE_RULES.can_double(hand)
+        )
+        self.buttons["split"].disabled = not self.can_split(hand)
+        self.buttons["surrender"].disabled = not TABLE_RULES.can_surrender(hand)
+
+    async def hit(self):
+        await self.draw_card()
+        self.update_buttons()
 
     async def stand(self):
         self.active_hand.remove_class("active")
@@ -315,10 +577,9 @@ class BlackjackApp(App):
         if self.active_hand.hand.state == HandState.ACTIVE:
             self.active_hand.hand.state = HandState.STAND
 
-        hands = self.query(HandDisplay)
-        if self.hand_idx < len(hands) - 1:
+        if self.hand_idx < len(self.pool) - 1:
             self.hand_idx += 1
-            self.active_hand = hands[self.hand_idx]
+            self.active_hand = self.hand_displays[self.hand_idx]
             self.active_hand.remove_class("inactive")
             self.active_hand.add_class("active")
             self.active_hand.scroll_visible()
@@ -326,53 +587,48 @@ class BlackjackApp(App):
                 await self.draw_card()
             await self.active_hand.update()
 
-            _, total11 = self.active_hand.hand.get_total()
-            if total11 == 21:
-                self.active_hand.hand.state = HandState.BLACKJACK
+            if TABLE_RULES.must_stand(self.active_hand.hand, len(self.pool)):
+                await self.stand()
             else:
-                self.query_one("#hit").disabled = False
-                self.query_one("#double").disabled = False
-                self.query_one("#split").disabled = False
-
-            self.query_one("#stand").disabled = False
-            self.query_one("#surrender").disabled = False
+                self.update_buttons()
 
         else:
             await self.end_round()
 
     async def surrender(self):
         self.active_hand.hand.state = HandState.SURRENDER
-        self.balance += self.active_hand.hand.bet * 50
-        self.player_balance = f"${self.balance / 100:.2f}"
         await self.active_hand.update()
         await self.stand()
 
     async def split(self):
         hand = self.active_hand.hand
-        split_card = hand.cards.pop()
-
-        self.balance = self.balance - hand.bet * 100
-        self.player_balance = f"${self.balance / 100:.2f}"
+        hand.split = True
+        split_card = hand.pop_card()
 
-        await self.draw_card()
+        self.balance = self.balance - stake(hand.bet)
+        self.player_balance = format_cents(self.balance)
 
-        new_hand = HandDisplay(
-            hand=Hand(bet=self.active_hand.hand.bet), classes="inactive"
-        )
+        new_hand = self.take_hand(hand.bet)
+        new_hand.hand.split = True
         new_hand.hand.add_card(split_card)
-        await self.query_one("#player_hands").mount(new_hand)
-
         await new_hand.update()
-        self.refresh()
-        self.refresh_css(animate=True)
+
+        await self.draw_card()
+
+        if TABLE_RULES.must_stand(hand, len(self.pool)):
+            await self.stand()
+        else:
+            self.update_buttons()
 
     async def end_round(self) -> None:
-        self.query_one("#hit").disabled = True
-        self.query_one("#stand").disabled = True
-        self.query_one("#double").disabled = True
-        self.query_one("#split").disabled = True
-        self.query_one("#surrender").disabled = True
-        self.query_one("#deal").disabled = False
+        self.buttons["hit"].disabled = True
+        self.buttons["stand"].disabled = True
+        self.buttons["double"].disabled = True
+        self.buttons["split"].disabled = True
+        self.buttons["surrender"].disabled = True
+        self.buttons["deal"].disabled = False
+        self.workers.cancel_group(self, "recommendations")
+        self.next_recommendations.update(Text(""))
 
         # Run Dealer Hand
         self.dealer_hand.dealer = False
@@ -388,51 +644,52 @@ class BlackjackApp(App):
             else "Blackjack :("
         )
 
-        hands = self.query(HandDisplay)
-
-        for hand in hands:
-            match hand.hand.state:
-                case HandState.BLACKJACK:
-                    if self.dealer_hand.state == HandState.BLACKJACK:
-                        hand.result = f"Push! You get back ${hand.hand.bet:.2f}!"
-                        self.balance += hand.hand.bet * 100
-                    else:
-                        hand.result = f"Blackjack! You win ${hand.hand.bet*1.5:.2f}!"
-                        self.balance += hand.hand.bet * 250
-                case HandState.BUST:
-                    hand.result = f"BUST! You lose ${hand.hand.bet:.2f}!"
-                case HandState.SURRENDER:
-                    hand.result = f"Surrendered! You get back ${hand.hand.bet*0.5:.2f}!"
-                    self.balance += hand.hand.bet * 150
-                case HandState.STAND:
-                    _, player_total = hand.hand.get_total()
-                    if total1 > 21:
-                        hand.result = f"Dealer BUSTS! You win ${hand.hand.bet:.2f}!"
-                        self.balance += hand.hand.bet * 200
-                    elif total11 > player_total:
-                        hand.result = f"Dealer wins! You lose ${hand.hand.bet:.2f}!"
-                    elif total11 == player_total:
-                        hand.result = f"Push! You get back ${hand.hand.bet:.2f}!"
-                        self.balance += hand.hand.bet * 100
-                    else:
-                        hand.result = f"You win ${hand.hand.bet:.2f}!"
-                        self.balance += hand.hand.bet * 200
-            await hand.update()
-
-        self.player_balance = f"${self.balance / 100:.2f}"
+        for display in self.hand_displays[: len(self.pool)]:
+            hand = display.hand
+            result = outcome(hand, self.dealer_hand)
+            wagered = stake(hand.bet)
+            returned = payout(result, hand.bet)
+            match result:
+                case Outcome.BLACKJACK:
+                    display.result = (
+                        f"Blackjack! You win {format_cents(returned - wagered)}!"
+                    )
+                case Outcome.SURRENDER:
+                    display.result = (
+                        f"Surrendered! You get back {format_cents(returned)}!"
+                    )
+                case Outcome.PUSH:
+                    display.result = f"Push! You get back {format_cents(returned)}!"
+                case Outcome.WIN if total1 > 21:
+                    display.result = (
+                        f"Dealer BUSTS! You win {format_cents(returned - wagered)}!"
+                    )
+                case Outcome.WIN:
+                    display.result = f"You win {format_cents(returned - wagered)}!"
+                case Outcome.LOSS if hand.state == HandState.BUST:
+                    display.result = f"BUST! You lose {format_cents(wagered)}!"
+                case Outcome.LOSS:
+                    display.result = f"Dealer wins! You lose {format_cents(wagered)}!"
+            self.balance += returned
+            self.stats.record_hand(wagered, returned, self.round_count)
+            await display.update()
+
+        self.player_balance = format_cents(self.balance)
+        self.update_stats()
 
         if self.shoot.reshuffle >= len(self.shoot.cards):
             self.shoot.shuffle()
             self.cards_remaining = len(self.shoot.cards) - self.shoot.reshuffle
+            self.update_side_bets()
 
-        self.query_one("#deal", Button).disabled = False
+        self.buttons["deal"].disabled = False
 
     async def draw_card(self, dealer: bool = False) -> None:
         if dealer:
             hand = self.dealer_hand
             hand.add_card(self.shoot.draw())
             total1, total11 = hand.get_total()
-            if total11 == 21 and len(hand.cards) == 2:
+            if hand.is_blackjack():
                 hand.state = HandState.BLACKJACK
                 if dealer:
                     self.dealer_total = "Blackjack :("
@@ -444,11 +701,65 @@ class BlackjackApp(App):
                 self.dealer_total = f"Total: {total11}"
         else:
             hand = self.active_hand.hand
-            hand.add_card(self.shoot.draw())
+            state = hand.get_state()
+            can_split = self.can_split_next(hand)
+            card = self.shoot.draw()
+            hand.add_card(card)
+            if self.dealer_hand.cards:
+                self.recommend(state, card, can_split)
             await self.active_hand.update()
 
         self.cards_remaining = len(self.shoot.cards) - self.shoot.reshuffle
         self.count = self.shoot.count
+        self.update_side_bets()
+
+    def recommend(self, state: int, card: Card, can_split: bool) -> None:
+        """Shows the move for the active hand, which has just drawn `card` in `state`.
+
+        `can_split` says whether the hand may be split if `card` made it a pair.
+
+        The move comes from those worked out for `state`, normally in the
+        background before the card was drawn, so it changes in the same frame as
+        the card. The moves after the next card are then worked out in turn.
+        """
+        upcard = self.dealer_hand.cards[0].value
+        move = STRATEGY.next_moves(state, upcard, can_split)[card.value - 1]
+        self.recommended_strategy = move.name if move else "BUST"
+        if move:
+            drawn = next_state(state, card.value, can_split)
+            self.run_worker(
+                partial(
+                    self.show_next_moves,
+                    drawn,
+                    upcard,
+                    self.can_split_next(self.active_hand.hand),
+                ),
+                group="recommendations",
+                exclusive=True,
+            )
+        else:
+            self.next_recommendations.update(Text(""))
+
+    async def show_next_moves(self, state: int, upcard: int, can_split: bool) -> None:
+        moves = STRATEGY.next_moves(state, upcard, can_split)
+        parts: list[str | tuple[str, str]] = ["Next card:"]
+        for value, move in zip(UPCARDS, moves):
+            parts.append(f"  {UPCARD_LABELS[value]} ")
+            if move:
+                parts.append((move.value, MOVE_STYLES[move.value]))
+            else:
+                parts.append(("BUST", "dim"))
+        self.next_recommendations.update(Text.assemble(*parts))
+
+    def update_side_bets(self) -> None:
+        # The dealer's hole card has left the shoot but is still unseen
+        counts = list(self.shoot.remaining)
+        if self.dealer_hand.dealer and len(self.dealer_hand.cards) > 1:
+            counts[self.dealer_hand.cards[1].index] += 1
+
+        self.side_bets = "Side bet EV: " + "  ".join(
+            f"{name} {ev:+.2%}" for name, ev in side_bet_evs(counts).items()
+        )
 
     @on(Input.Changed)
     def show_invalid_reasons(self, event: Input.Changed) -> None:
@@ -468,94 +779,21 @@ class BlackjackApp(App):
         else:
             self.query_one(error, expect_type=Pretty).update([])
 
-    def on_mount(self) -> None:
-        lookup = {
-            "hard-totals": STRATEGY.hard_totals,
-            "soft-totals": STRATEGY.soft_totals,
-            "splits_table": STRATEGY.splits,
-        }
+    async def reveal(self, location: str) -> None:
+        column = self.query_one(location)
+        if isinstance(column, LazyColumn):
+            await column.ensure_built()
+        self.call_after_refresh(column.scroll_visible, top=True, duration=0.5)
 
-        for strategy in [
-            "hard-totals",
-            "soft-totals",
-            "splits_table",
-            "surrender_table",
-        ]:
-            match strategy:
-                case "surrender_table":
-                    table: DataTable = self.app.query_one(
-                        "#surrender_table", expect_type=DataTable
-                    )
-                    columns = ["Hand", "9", "10", "A"]
-                    rows = [
-                        (
-                            16,
-                            Text("SUR", style="bold red"),
-                            Text("SUR", style="bold red"),
-                            Text("SUR", style="bold red"),
-                        ),
-                        (15, "", Text("SUR", style="bold red"), ""),
-                    ]
-                    table.add_columns(*columns)
-                    table.add_rows(rows)
-
-                case _:
-                    table: DataTable = self.app.query_one(
-                        f"#{strategy}", expect_type=DataTable
-                    )
-                    self.data = lookup[strategy].reset_index()
-                    table.add_columns(*[str(x) for x in self.data.columns])
-                    for row in self.data.itertuples(index=False):
-                        styled_row = []
-                        for cell in row:
-                            match str(cell):
-                                case "H":
-                                    styled_row.append(Text(str(cell), style="bold"))
-                                case "S":
-                                    styled_row.append(
-                                        Text(str(cell), style="bold yellow")
-                                    )
-                                case "D":
-                                    styled_row.append(
-                                        Text(str(cell), style="bold green")
-                                    )
-                                case "Ds":
-                                    styled_row.append(
-                                        Text(str(cell), style="bold green")
-                                    )
-                                case "Y":
-                                    styled_row.append(
-                                        Text(str(cell), style="bold green")
-                                    )
-                                case "N":
-                                    styled_row.append(Text(str(cell), style="bold red"))
-                                case "SUR":
-                                    styled_row.append(Text(str(cell), style="bold red"))
-                                case _:
-                                    styled_row.append(Text(str(cell)))
-                        table.add_row(*styled_row)
-
-        table: DataTable = self.app.query_one("#strategy-legend", expect_type=DataTable)
-        table.add_columns("Strategy", "Description")
-        rows = [
-            (Text("H", style="bold"), "Hit"),
-            (Text("S", style="bold yellow"), "Stand"),
-            (Text("D", style="bold green"), "Double"),
-            (Text("Ds", style="bold green"), "Double if allowed, otherwise Stand"),
-            (Text("Y", style="bold green"), "Split"),
-            (Text("N", style="bold red"), "Don't Split"),
-            (Text("SUR", style="bold red"), "Surrender"),
-        ]
-        table.add_rows(rows)
+    def update_stats(self) -> None:
+        for section in self.query(StatsSection):
+            section.update_stats()
 
     def action_toggle_dark(self):
         self.dark = not self.dark
 
-    async def watch_recommended_strategy(self, value: str) -> None:
-        await self.mount()
-        self.query_one("#strategy_recommendation", expect_type=TextContent).update(
-            Text(f"Strategy Recommendation: {value}")
-        )
+    def watch_recommended_strategy(self, value: str) -> None:
+        self.recommendation.update(Text(f"Strategy Recommendation: {value}"))
 
     async def watch_count(self, value: int) -> None:
         await self.mount()
@@ -563,6 +801,12 @@ class BlackjackApp(App):
             Text(f"Count: {value}")
         )
 
+    async def watch_side_bets(self, value: str) -> None:
+        await self.mount()
+        self.query_one("#side_bets_display", expect_type=TextContent).update(
+            Text(value)
+        )
+
     async def watch_cards_remaining(self, value: int) -> None:
         await self.mount()
         self.query_one("#cards_remaining", expect_type=TextContent).update(
@@ -32,10 +32,13 @@ End your turn.
 You can only double on your first 2 cards. You double your bet and draw only 1 more card to end your turn.
 
 ### Split
-If you have 2 cards of the same rank, you can split them into 2 hands. You must bet the same amount on the second hand. For now, this app only supports splitting once. In the future, I may add the ability to split multiple times.
+If you have 2 cards of the same rank, you can split them into 2 hands. You must bet the same amount on the second hand.
+You can split again if you are dealt another pair, up to 4 hands in total.
+Split aces receive one card each and cannot be split again.
+You can double down after splitting.
 
 ### Surrender
-You can only surrender on your first 2 cards. You lose half your bet and end your turn.
+You can only surrender on your first 2 cards, and not after splitting. You lose half your bet and end your turn.
 
 ## Dealer
 The dealer follows the following rules:
@@ -54,3 +57,17 @@ Either way, the game continues as normal.
 STRATEGY_INTRO = """
 The `Hand` column represents the player's hand. The other columns represent the dealer's face up card.
 """
+
+
+TRAINER_INTRO = """
+Drill the basic strategy chart without playing full rounds.
+Pick the move you would make for each hand, and you will immediately see if it matches the chart.
+Situations you get wrong come up more often until you get them right.
+"""
+
+
+STATS_INTRO = """
+Your session statistics are updated at the end of every round.
+Strategy adherence compares each of your moves with the basic strategy recommendation.
+The count breakdown groups hands by the running count at the start of the round.
+"""
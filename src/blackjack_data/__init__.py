@@ -0,0 +1 @@
+"""The basic strategy charts, shipped as package data."""
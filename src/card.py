@@ -1,42 +1,92 @@
-import random
 from dataclasses import dataclass, field
+from typing import Sequence
 
 from enums import Rank, Suit
+from shuffles import PythonRng, Rng, Shuffler, uniform
 
 
-@dataclass
 class Card:
+    """One of the 52 distinct cards.
+
+    Cards are immutable flyweights: `Card(suit, rank)` always returns the same
+    instance, with its text and unicode renderings worked out once.
+    """
+
+    __slots__ = ("suit", "rank", "index", "value", "_text", "_unicode")
+    _interned: dict[tuple[Suit, Rank], "Card"] = {}
+
     suit: Suit
     rank: Rank
+    index: int  # Position in a single ordered deck, from 0 to 51
+    value: int  # Blackjack value, with the ace as 1
+
+    def __new__(cls, suit: Suit, rank: Rank) -> "Card":
+        card = cls._interned.get((suit, rank))
+        if card is None:
+            card = super().__new__(cls)
+            for name, value in [
+                ("suit", suit),
+                ("rank", rank),
+                ("index", (suit.value - 1) * 13 + rank.value - 1),
+                ("value", min(rank.value, 10)),
+                ("_text", cls._render(suit, rank)),
+                ("_unicode", cls._render_unicode(suit, rank)),
+            ]:
+                object.__setattr__(card, name, value)
+            cls._interned[(suit, rank)] = card
+        return card
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError("Cards are immutable")
+
+    def __reduce__(self):
+        return Card, (self.suit, self.rank)
+
+    def __copy__(self) -> "Card":
+        return self
+
+    def __deepcopy__(self, memo: dict) -> "Card":
+        return self
+
+    def __repr__(self) -> str:
+        return f"Card(suit={self.suit!r}, rank={self.rank!r})"
 
     def __str__(self):
-        match self.suit:
+        return self._text
+
+    def unicode(self) -> str:
+        return self._unicode
+
+    @staticmethod
+    def _render(suit: Suit, rank: Rank) -> str:
+        match suit:
             case Suit.HEARTS:
-                suit = "♥️"
+                suit_str = "♥️"
             case Suit.DIAMONDS:
-                suit = "♦️"
+                suit_str = "♦️"
             case Suit.CLUBS:
-                suit = "♣️"
+                suit_str = "♣️"
             case Suit.SPADES:
-                suit = "♠️"
+                suit_str = "♠️"
 
-        match self.rank:
+        match rank:
             case Rank.ACE:
-                rank = "A"
+                rank_str = "A"
             case Rank.JACK:
-                rank = "J"
+                rank_str = "J"
             case Rank.QUEEN:
-                rank = "Q"
+                rank_str = "Q"
             case Rank.KING:
-                rank = "K"
+                rank_str = "K"
             case _:
-                rank = str(self.rank.value)
+                rank_str = str(rank.value)
 
-        return f"[{rank}{suit}]"
+        return f"[{rank_str}{suit_str}]"
 
-    def unicode(self) -> str:
+    @staticmethod
+    def _render_unicode(suit: Suit, rank: Rank) -> str:
         ret = 127136
-        match self.suit:
+        match suit:
             case Suit.HEARTS:
                 ret += 16
             case Suit.DIAMONDS:
@@ -44,35 +94,77 @@ class Card:
             case Suit.CLUBS:
                 ret += 16 * 3
 
-        ret += self.rank.value
+        ret += rank.value
         return "&#" + hex(ret)[1:] + ";"
 
 
+# Every distinct card, in `Card.index` order
+DECK = tuple(Card(suit, rank) for suit in Suit for rank in Rank)
+
+
+def hi_lo(card: Card) -> int:
+    """The card's tag in the Hi-Lo count."""
+    if 2 <= card.value <= 6:
+        return 1
+    if card.value == 1 or card.value == 10:
+        return -1
+    return 0
+
+
+PENETRATION = 0.85
+MIN_RESERVE = 20  # cards behind the cut, so a round never runs out of cards
+
+
 @dataclass
 class Shoot:
     decks: int
     count: int = 0
+    penetration: float = PENETRATION
+    rng: Rng = field(default_factory=PythonRng, repr=False)
+    shuffler: Shuffler = field(default=uniform, repr=False)
     cards: list[Card] = field(init=False, default_factory=list)
     reshuffle: int = field(init=False)
+    remaining: list[int] = field(init=False)
+    dealt: list[int] = field(init=False, default_factory=list, repr=False)
 
     def __post_init__(self):
-        self.cards = [Card(suit, rank) for suit in Suit for rank in Rank] * self.decks
-        random.shuffle(self.cards)
-        self.reshuffle = int(len(self.cards) * 0.15)
+        # However deep the cut, small shoes keep MIN_RESERVE cards behind it
+        self.reshuffle = max(int(self.decks * 52 * (1 - self.penetration)), MIN_RESERVE)
+        self.remaining = [self.decks] * 52
+        self.load(self.shuffler(list(range(52)) * self.decks, self.rng))
 
     def cut(self, pos: int):
         self.cards = self.cards[pos:] + self.cards[:pos]
 
     def draw(self) -> Card:
         card = self.cards.pop()
-        if card.rank.value >= 2 and card.rank.value <= 6:
-            self.count += 1
-        elif card.rank.value == 1 or card.rank.value >= 10:
-            self.count -= 1
-
+        self.dealt.append(card.index)
+        self.remaining[card.index] -= 1
+        self.count += hi_lo(card)
         return card
 
+    def true_count(self, unseen: Sequence[Card] = ()) -> float:
+        """Running count per deck left, leaving out cards drawn face down.
+
+        At least half a deck is assumed to be left, so the count stays sane
+        right before a reshuffle.
+        """
+        count = self.count - sum(map(hi_lo, unseen))
+        decks = (len(self.cards) + len(unseen)) / 52
+        return count / max(decks, 0.5)
+
     def shuffle(self):
-        self.cards = [Card(suit, rank) for suit in Suit for rank in Rank] * self.decks
-        random.shuffle(self.cards)
+        # The dealt cards are picked up in the order they were dealt, and the
+        # cards left in the shoot go on top of them before the shuffle
+        stack = self.dealt + [card.index for card in self.cards]
+        self.load(self.shuffler(stack, self.rng))
+
+    def load(self, order: Sequence[int]) -> None:
+        """Replaces the cards with a prepared shoe of `Card.index` values.
+
+        Cards are dealt from the end of `order`, as they are from `cards`.
+        """
+        self.cards[:] = [DECK[idx] for idx in order]
+        self.dealt.clear()
         self.count = 0
+        self.remaining[:] = [self.decks] * 52
@@ -0,0 +1,253 @@
+"""Headless game engine that plays whole rounds without the TUI.
+
+It follows the same table rules and dealing order as `BlackjackApp`, and is
+checked against the reference implementation in the tests.
+"""
+
+from dataclasses import dataclass, field
+from typing import Callable
+
+from card import Shoot, hi_lo
+from enums import HandState, StrategyMove
+from hand import Hand, HandPool
+from rules import TableRules
+from settlement import Outcome, outcome, payout, stake
+from states import PlayerState
+from strategy import Strategy
+
+
+@dataclass
+class Situation:
+    """Everything a policy may look at when making a decision."""
+
+    hand: Hand
+    dealer_hand: Hand
+    shoot: Shoot
+    can_double: bool = False
+    can_split: bool = False
+    can_surrender: bool = False
+
+
+Policy = Callable[[Situation], StrategyMove]
+
+# Hi-Lo index plays for hard totals against an upcard, with the ace as 1. At or
+# above the true count the first move is made, below it the second one.
+DEVIATIONS = {
+    (16, 10): (0, StrategyMove.STAND, StrategyMove.HIT),
+    (15, 10): (4, StrategyMove.STAND, StrategyMove.HIT),
+    (16, 9): (5, StrategyMove.STAND, StrategyMove.HIT),
+    (13, 2): (-1, StrategyMove.STAND, StrategyMove.HIT),
+    (13, 3): (-2, StrategyMove.STAND, StrategyMove.HIT),
+    (12, 2): (3, StrategyMove.STAND, StrategyMove.HIT),
+    (12, 3): (2, StrategyMove.STAND, StrategyMove.HIT),
+    (12, 4): (0, StrategyMove.STAND, StrategyMove.HIT),
+    (12, 5): (-2, StrategyMove.STAND, StrategyMove.HIT),
+    (12, 6): (-1, StrategyMove.STAND, StrategyMove.HIT),
+    (10, 10): (4, StrategyMove.DOUBLE, StrategyMove.HIT),
+    (10, 1): (3, StrategyMove.DOUBLE, StrategyMove.HIT),
+    (9, 2): (1, StrategyMove.DOUBLE, StrategyMove.HIT),
+    (9, 7): (3, StrategyMove.DOUBLE, StrategyMove.HIT),
+}
+
+# True counts from which a pair of tens is split against a 5 or a 6.
+TEN_SPLITS = {5: 5, 6: 4}
+
+
+def basic_strategy(strategy: Strategy) -> Policy:
+    def policy(situation: Situation) -> StrategyMove:
+        return strategy.get_strategy(
+            situation.hand, situation.dealer_hand, allow_split=situation.can_split
+        )
+
+    return policy
+
+
+def count_deviations(strategy: Strategy) -> Policy:
+    """Basic strategy, adjusted by the Hi-Lo true count."""
+
+    def policy(situation: Situation) -> StrategyMove:
+        state = PlayerState.decode(
+            situation.hand.get_state(can_split=situation.can_split)
+        )
+        upcard = situation.dealer_hand.cards[0].value
+        move = strategy.get_move(state.code, upcard)
+        if move == StrategyMove.SPLIT or (
+            move == StrategyMove.SURRENDER and situation.can_surrender
+        ):
+            return move
+
+        true_count = situation.shoot.true_count(situation.dealer_hand.cards[1:])
+        if state.pair == 10 and state.can_split and upcard in TEN_SPLITS:
+            if true_count >= TEN_SPLITS[upcard]:
+                return StrategyMove.SPLIT
+        elif not state.soft and (state.total, upcard) in DEVIATIONS:
+            index, above, below = DEVIATIONS[state.total, upcard]
+            return above if true_count >= index else below
+        return move
+
+    return policy
+
+
+def never_bust(situation: Situation) -> StrategyMove:
+    """Hits only when the next card can't bust the hand."""
+    total1, total11 = situation.hand.get_total()
+    if total1 <= 11 or total1 < total11 <= 17:
+        return StrategyMove.HIT
+    return StrategyMove.STAND
+
+
+def mimic_dealer(situation: Situation) -> StrategyMove:
+    """Plays the hand by the dealer's rule, hitting soft 17."""
+    total1, total11 = situation.hand.get_total()
+    if total1 < 17 and total11 < 18:
+        return StrategyMove.HIT
+    return StrategyMove.STAND
+
+
+def resolve(move: StrategyMove, situation: Situation) -> StrategyMove:
+    """Turns a recommendation into a move that is allowed in the situation."""
+    match move:
+        case StrategyMove.DOUBLE if not situation.can_double:
+            return StrategyMove.HIT
+        case StrategyMove.DOUBLE_ALLOWED:
+            if situation.can_double:
+                return StrategyMove.DOUBLE
+            return StrategyMove.STAND
+        case StrategyMove.SPLIT if not situation.can_split:
+            return StrategyMove.HIT
+        case StrategyMove.DONT_SPLIT:
+            return StrategyMove.HIT
+        case StrategyMove.SURRENDER if not situation.can_surrender:
+            return StrategyMove.HIT
+        case _:
+            return move
+
+
+@dataclass
+class RoundResult:
+    outcomes: list[Outcome] = field(default_factory=list)
+    bets: list[int] = field(default_factory=list)  # dollars
+    reshuffled: bool = False  # The shoe reached the cut with this round
+
+    @property
+    def hands(self) -> int:
+        return len(self.outcomes)
+
+    @property
+    def wagered(self) -> int:
+        return stake(sum(self.bets))
+
+    @property
+    def returned(self) -> int:
+        return sum(map(payout, self.outcomes, self.bets))
+
+    @property
+    def net(self) -> int:
+        return self.returned - self.wagered
+
+
+@dataclass
+class Engine:
+    shoot: Shoot
+    policy: Policy
+    rules: TableRules = field(default_factory=TableRules)
+    moves: dict[StrategyMove, int] = field(init=False)
+
+    def __post_init__(self):
+        self.pool = HandPool(self.rules.max_hands)
+        self.dealer_hand = Hand(dealer=True)
+        self.situation = Situation(self.pool.hands[0], self.dealer_hand, self.shoot)
+        self.moves = dict.fromkeys(StrategyMove, 0)
+
+    def play_round(self, bet: int, reshuffle: bool = True) -> RoundResult:
+        """Plays one round with a bet in dollars, reshuffling when it's due.
+
+        Without `reshuffle` a finished shoe is left as it is, for the caller to
+        replace.
+        """
+        self.pool.reset()
+        self.dealer_hand.reset()
+        self.dealer_hand.dealer = True
+
+        hand = self.pool.take(bet)
+        for _ in range(2):
+            hand.add_card(self.shoot.draw())
+            self.dealer_hand.add_card(self.shoot.draw())
+
+        if hand.is_blackjack():
+            hand.state = HandState.BLACKJACK
+
+        if not self.dealer_hand.is_blackjack():
+            idx = 0
+            while idx < len(self.pool):
+                self.play_hand(self.pool.hands[idx])
+                idx += 1
+        else:
+            self.dealer_hand.state = HandState.BLACKJACK
+
+        result = self.settle()
+
+        if self.shoot.reshuffle >= len(self.shoot.cards):
+            if reshuffle:
+                self.shoot.shuffle()
+            result.reshuffled = True
+
+        return result
+
+    def play_hand(self, hand: Hand) -> None:
+        rules = self.rules
+        situation = self.situation
+        situation.hand = hand
+
+        if len(hand.cards) < 2:
+            hand.add_card(self.shoot.draw())
+
+        while hand.state == HandState.ACTIVE:
+            if rules.must_stand(hand, len(self.pool)) or not rules.can_hit(hand):
+                hand.state = HandState.STAND
+                break
+
+            situation.can_double = rules.can_double(hand)
+            situation.can_split = rules.can_split(hand, len(self.pool))
+            situation.can_surrender = rules.can_surrender(hand)
+            move = resolve(self.policy(situation), situation)
+            self.moves[move] += 1
+
+            match move:
+                case StrategyMove.HIT:
+                    self.hit(hand)
+                case StrategyMove.DOUBLE:
+                    hand.bet *= 2
+                    self.hit(hand)
+                    if hand.state == HandState.ACTIVE:
+                        hand.state = HandState.STAND
+                case StrategyMove.SPLIT:
+                    hand.split = True
+                    new_hand = self.pool.take(hand.bet)
+                    new_hand.split = True
+                    new_hand.add_card(hand.pop_card())
+                    hand.add_card(self.shoot.draw())
+                case StrategyMove.SURRENDER:
+                    hand.state = HandState.SURRENDER
+                case _:
+                    hand.state = HandState.STAND
+
+    def hit(self, hand: Hand) -> None:
+        hand.add_card(self.shoot.draw())
+        total1, _ = hand.get_total()
+        if total1 > 21:
+            hand.state = HandState.BUST
+
+    def settle(self) -> RoundResult:
+        dealer_hand = self.dealer_hand
+        dealer_hand.dealer = False
+        total1, total11 = dealer_hand.get_total()
+        while total1 < 17 and total11 < 18:
+            dealer_hand.add_card(self.shoot.draw())
+            total1, total11 = dealer_hand.get_total()
+
+        result = RoundResult()
+        for hand in self.pool:
+            result.outcomes.append(outcome(hand, dealer_hand))
+            result.bets.append(hand.bet)
+        return result
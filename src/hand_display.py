@@ -0,0 +1,65 @@
+from textual.app import ComposeResult
+from textual.reactive import reactive
+from textual.widget import Widget
+
+from classes import TextContent
+from enums import HandState
+from hand import Hand
+
+
+class HandDisplay(Widget):
+    cards = reactive("")
+    total = reactive("")
+    bet = reactive("")
+    result = reactive("")
+
+    def __init__(self, hand: Hand, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.hand = hand
+        self.display = False  # Until `reset` hands it out for a new hand
+
+    def reset(self) -> None:
+        self.result = ""
+        self.display = True
+        self.remove_class("active")
+        self.add_class("inactive")
+
+    def compose(self) -> ComposeResult:
+        yield TextContent(self.cards, id="hand_cards")
+        yield TextContent(self.total, id="hand_total")
+        yield TextContent(self.bet, id="hand_bet")
+        yield TextContent(self.result, id="hand_result")
+
+    def on_mount(self) -> None:
+        self.cards = str(self.hand)
+        total1, total11 = self.hand.get_total()
+        if self.hand.is_blackjack():
+            self.total = "Blackjack! :)"
+        elif total1 > 21:
+            self.total = "BUST!"
+        elif total1 != total11:
+            self.total = f"Total: {total1}/{total11}"
+        else:
+            self.total = f"Total: {total11}"
+
+    async def update(self) -> None:
+        await self.mount()
+        self.log(self.tree)
+        total1, total11 = self.hand.get_total()
+        if self.hand.is_blackjack():
+            self.total = "Blackjack! :)"
+            self.hand.state = HandState.BLACKJACK
+        elif total1 > 21:
+            self.total = "BUST!"
+            self.hand.state = HandState.BUST
+        elif total1 != total11:
+            self.total = f"Total: {total1}/{total11}"
+        else:
+            self.total = f"Total: {total11}"
+
+        self.bet = self.hand.get_bet()
+
+        self.query_one("#hand_cards", expect_type=TextContent).update(str(self.hand))
+        self.query_one("#hand_total", expect_type=TextContent).update(self.total)
+        self.query_one("#hand_bet", expect_type=TextContent).update(self.bet)
+        self.query_one("#hand_result", expect_type=TextContent).update(self.result)
@@ -0,0 +1,46 @@
+from dataclasses import dataclass
+
+from enums import Rank
+from hand import Hand
+
+
+@dataclass(frozen=True)
+class TableRules:
+    max_hands: int = 4
+    resplit_aces: bool = False
+    hit_split_aces: bool = False
+    double_after_split: bool = True
+
+    def is_split_aces(self, hand: Hand) -> bool:
+        return hand.split and hand.cards[0].rank == Rank.ACE
+
+    def can_hit(self, hand: Hand) -> bool:
+        if self.is_split_aces(hand) and not self.hit_split_aces:
+            return False
+        _, total11 = hand.get_total()
+        return total11 < 21
+
+    def can_double(self, hand: Hand) -> bool:
+        if hand.split and not self.double_after_split:
+            return False
+        return len(hand.cards) == 2 and self.can_hit(hand)
+
+    def can_split(self, hand: Hand, num_hands: int) -> bool:
+        if len(hand.cards) != 2 or num_hands >= self.max_hands:
+            return False
+        if self.is_split_aces(hand) and not self.resplit_aces:
+            return False
+        card1, card2 = hand.cards
+        return card1.value == card2.value
+
+    def can_surrender(self, hand: Hand) -> bool:
+        return not hand.split and len(hand.cards) == 2 and self.can_hit(hand)
+
+    def must_stand(self, hand: Hand, num_hands: int) -> bool:
+        """Split aces that may not be hit are done once they have two cards."""
+        return (
+            len(hand.cards) == 2
+            and self.is_split_aces(hand)
+            and not self.can_hit(hand)
+            and not self.can_split(hand, num_hands)
+        )
@@ -0,0 +1,123 @@
+"""Settlement of finished hands, in integer cents only.
+
+Every hand ends in one of a handful of outcomes, and what it returns is a
+fixed multiple of its bet. The app and the engine settle one hand at a time
+through `payout`, while the simulator hands whole chunks of outcomes to
+`settle_bulk`.
+"""
+
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Sequence
+
+from enums import HandState
+from hand import Hand
+
+CENTS = 100
+
+
+class Outcome(IntEnum):
+    LOSS = 0
+    PUSH = 1
+    WIN = 2
+    BLACKJACK = 3
+    SURRENDER = 4
+
+
+# Cents returned per dollar bet, stake included, indexed by outcome.
+PAYOUTS = (0, 100, 200, 250, 50)
+
+
+def outcome(hand: Hand, dealer_hand: Hand) -> Outcome:
+    """Outcome of a finished hand against the dealer's finished hand."""
+    dealer_blackjack = dealer_hand.state == HandState.BLACKJACK
+    match hand.state:
+        case HandState.SURRENDER:
+            return Outcome.SURRENDER
+        case HandState.BLACKJACK:
+            return Outcome.PUSH if dealer_blackjack else Outcome.BLACKJACK
+        case HandState.BUST:
+            return Outcome.LOSS
+
+    if dealer_blackjack:
+        return Outcome.LOSS
+    _, player_total = hand.get_total()
+    _, dealer_total = dealer_hand.get_total()
+    if dealer_total > 21 or player_total > dealer_total:
+        return Outcome.WIN
+    if player_total == dealer_total:
+        return Outcome.PUSH
+    return Outcome.LOSS
+
+
+def stake(bet: int) -> int:
+    """A bet in dollars, in cents."""
+    return bet * CENTS
+
+
+def payout(outcome: Outcome, bet: int) -> int:
+    """Cents returned for a bet in dollars, stake included."""
+    return PAYOUTS[outcome] * bet
+
+
+def format_cents(cents: int) -> str:
+    sign = "-" if cents < 0 else ""
+    dollars, cents = divmod(abs(cents), CENTS)
+    return f"{sign}${dollars}.{cents:02d}"
+
+
+@dataclass
+class Totals:
+    wagered: int = 0  # cents
+    returned: int = 0  # cents
+    net_squared: int = 0  # cents², summed per round
+
+    @property
+    def net(self) -> int:
+        return self.returned - self.wagered
+
+
+def settle_bulk(
+    outcomes: Sequence[int], bets: Sequence[int], starts: Sequence[int]
+) -> Totals:
+    """Settles many rounds at once.
+
+    `outcomes` and `bets` (in dollars) hold one entry per hand, and `starts`
+    holds the index of each round's first hand. Uses numpy when it's
+    installed, and the same table in pure Python otherwise.
+    """
+    if not len(outcomes):
+        return Totals()
+
+    try:
+        import numpy as np
+    except ImportError:
+        return _settle_bulk_python(outcomes, bets, starts)
+
+    bets_array = np.asarray(bets, dtype=np.int64)
+    returned = np.asarray(PAYOUTS, dtype=np.int64)[np.asarray(outcomes, dtype=np.intp)]
+    returned *= bets_array
+    nets = np.add.reduceat(
+        returned - bets_array * CENTS, np.asarray(starts, dtype=np.intp)
+    )
+    return Totals(
+        wagered=int(bets_array.sum()) * CENTS,
+        returned=int(returned.sum()),
+        net_squared=int((nets * nets).sum()),
+    )
+
+
+def _settle_bulk_python(
+    outcomes: Sequence[int], bets: Sequence[int], starts: Sequence[int]
+) -> Totals:
+    totals = Totals()
+    ends = [*starts[1:], len(outcomes)]
+    for start, end in zip(starts, ends):
+        wagered = returned = 0
+        for idx in range(start, end):
+            wagered += bets[idx] * CENTS
+            returned += PAYOUTS[outcomes[idx]] * bets[idx]
+        totals.wagered += wagered
+        totals.returned += returned
+        totals.net_squared += (returned - wagered) ** 2
+    return totals
@@ -0,0 +1,238 @@
+"""Random number generators and shuffle models for the shoot.
+
+Shuffles work on lists of `Card.index` values, with the top of the stack at
+the end, like `Shoot.cards`. Besides a perfectly random shuffle there are
+models of the shuffles dealers actually do, whose imperfection leaves some of
+the previous order behind for shuffle trackers to find.
+"""
+
+import random
+from dataclasses import dataclass
+from typing import Callable, Protocol
+
+
+class Rng(Protocol):
+    def random(self) -> float:
+        """A float in [0, 1)."""
+
+    def below(self, n: int) -> int:
+        """An int in [0, n)."""
+
+    def bits(self, n: int) -> list[int]:
+        """`n` independent fair bits."""
+
+    def permutation(self, cards: list[int]) -> list[int]:
+        """A uniformly random reordering of `cards`."""
+
+
+class PythonRng:
+    """An `Rng` backed by `random.Random`, or anything with its interface.
+
+    By default it draws from the global `random` module, so `random.seed`
+    still makes a game reproducible.
+    """
+
+    def __init__(self, source=random) -> None:
+        self.source = source
+
+    def random(self) -> float:
+        return self.source.random()
+
+    def below(self, n: int) -> int:
+        return self.source.randrange(n)
+
+    def bits(self, n: int) -> list[int]:
+        value = self.source.getrandbits(n)
+        return [value >> idx & 1 for idx in range(n)]
+
+    def permutation(self, cards: list[int]) -> list[int]:
+        cards = list(cards)
+        self.source.shuffle(cards)
+        return cards
+
+
+class NumpyRng:
+    """An `Rng` backed by one of NumPy's bit generators, such as PCG64 or Philox.
+
+    Bits and permutations are drawn in a single vectorized call.
+    """
+
+    def __init__(self, bit_generator: str = "PCG64", seed: int | None = None) -> None:
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError(
+                f"The {bit_generator} generator needs NumPy, install it with "
+                "pip install 'blackjack[numpy]'"
+            ) from None
+
+        self.generator = np.random.Generator(getattr(np.random, bit_generator)(seed))
+
+    def random(self) -> float:
+        return float(self.generator.random())
+
+    def below(self, n: int) -> int:
+        return int(self.generator.integers(n))
+
+    def bits(self, n: int) -> list[int]:
+        return self.generator.integers(0, 2, n).tolist()
+
+    def permutation(self, cards: list[int]) -> list[int]:
+        return self.generator.permutation(cards).tolist()
+
+
+RNGS = ["global", "mersenne", "secrets", "pcg64", "philox"]
+
+
+def make_rng(name: str = "global", seed: int | None = None) -> Rng:
+    """An `Rng` by name. `secrets` draws from the OS and can't be seeded."""
+    match name:
+        case "global":
+            if seed is not None:
+                random.seed(seed)
+            return PythonRng()
+        case "mersenne":
+            return PythonRng(random.Random(seed))
+        case "secrets":
+            if seed is not None:
+                raise ValueError("The secrets generator can't be seeded")
+            return PythonRng(random.SystemRandom())
+        case "pcg64" | "philox":
+            return NumpyRng({"pcg64": "PCG64", "philox": "Philox"}[name], seed)
+    raise ValueError(f"Unknown generator {name!r}, expected one of {RNGS}")
+
+
+Shuffler = Callable[[list[int], Rng], list[int]]
+
+
+def uniform(cards: list[int], rng: Rng) -> list[int]:
+    """Every order equally likely, whatever the order before."""
+    return rng.permutation(cards)
+
+
+@dataclass(frozen=True)
+class Riffle:
+    """Cut the stack in two and riffle the halves together.
+
+    With an imperfection of 1 this is the Gilbert-Shannon-Reeds model, where
+    cards drop from each half in proportion to its size. At 0 the stack is cut
+    exactly in half and the halves alternate perfectly, and in between the
+    cut wanders and the halves drop in clumps.
+    """
+
+    imperfection: float = 1.0
+
+    def __call__(self, cards: list[int], rng: Rng) -> list[int]:
+        if self.imperfection >= 1:
+            # A card's half is a fair coin flip, which makes the cut binomial
+            bits = rng.bits(len(cards))
+            cut = len(cards) - sum(bits)
+            left, right = iter(cards[:cut]), iter(cards[cut:])
+            return [next(right) if bit else next(left) for bit in bits]
+
+        size = len(cards)
+        wander = round((2 * rng.random() - 1) * self.imperfection * size / 8)
+        cut = size // 2 + wander
+        left, right = cards[:cut], cards[cut:]
+
+        riffled = []
+        i = j = 0
+        from_left = rng.random() < 0.5
+        while i < len(left) and j < len(right):
+            proportional = (len(left) - i) / (len(left) - i + len(right) - j)
+            alternate = 0.0 if from_left else 1.0
+            chance = (1 - self.imperfection) * alternate
+            from_left = rng.random() < chance + self.imperfection * proportional
+            if from_left:
+                riffled.append(left[i])
+                i += 1
+            else:
+                riffled.append(right[j])
+                j += 1
+        riffled.extend(left[i:])
+        riffled.extend(right[j:])
+        return riffled
+
+
+@dataclass(frozen=True)
+class Strip:
+    """Pull packets off the top onto a new pile, reversing their order.
+
+    Packets average `len(cards) / packets` cards, and vary by up to
+    `imperfection` times that either way.
+    """
+
+    packets: int = 6
+    imperfection: float = 0.5
+
+    def __call__(self, cards: list[int], rng: Rng) -> list[int]:
+        size = len(cards) / self.packets
+        stripped = []
+        top = len(cards)
+        while top > 0:
+            take = size * (1 + self.imperfection * (2 * rng.random() - 1))
+            bottom = max(top - max(round(take), 1), 0)
+            stripped.extend(cards[bottom:top])
+            top = bottom
+        return stripped
+
+
+@dataclass(frozen=True)
+class Wash:
+    """Spread the cards out and mix them, as for a new shoe.
+
+    Each card stays stuck to the one below it with chance `imperfection`, and
+    the clumps are then mixed uniformly.
+    """
+
+    imperfection: float = 0.0
+
+    def __call__(self, cards: list[int], rng: Rng) -> list[int]:
+        if not self.imperfection or not cards:
+            return rng.permutation(cards)
+
+        clumps = [[cards[0]]]
+        for card in cards[1:]:
+            if rng.random() < self.imperfection:
+                clumps[-1].append(card)
+            else:
+                clumps.append([card])
+        order = rng.permutation(list(range(len(clumps))))
+        return [card for idx in order for card in clumps[idx]]
+
+
+@dataclass(frozen=True)
+class Cut:
+    """Cut the stack somewhere within `depth` of the middle."""
+
+    depth: float = 0.25
+
+    def __call__(self, cards: list[int], rng: Rng) -> list[int]:
+        size = len(cards)
+        span = int(size * self.depth)
+        pos = size // 2 - span + rng.below(2 * span + 1)
+        return cards[pos:] + cards[:pos]
+
+
+@dataclass(frozen=True)
+class Procedure:
+    """Several shuffles, one after another."""
+
+    steps: tuple[Shuffler, ...]
+
+    def __call__(self, cards: list[int], rng: Rng) -> list[int]:
+        for step in self.steps:
+            cards = step(cards, rng)
+        return cards
+
+
+# A typical dealer's shuffle of the whole shoot.
+CASINO = Procedure((Riffle(0.5), Riffle(0.5), Strip(), Riffle(0.5), Cut()))
+
+SHUFFLES: dict[str, Shuffler] = {
+    "uniform": uniform,
+    "riffle": Riffle(),
+    "strip": Strip(),
+    "wash": Wash(),
+    "casino": CASINO,
+}
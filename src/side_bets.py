@@ -0,0 +1,150 @@
+"""Side bet payouts and their exact odds for a given shoe composition.
+
+Odds are computed from the number of each of the 52 distinct cards left in
+the shoe (see `Shoot.remaining`), so they cost the same for 1 or 8 decks.
+"""
+
+from math import prod
+from typing import Sequence
+
+from card import Card
+from enums import Rank
+
+# Payouts are "to 1" on top of the returned stake
+INSURANCE = {"insurance": 2}
+PERFECT_PAIRS = {"perfect_pair": 25, "colored_pair": 12, "mixed_pair": 6}
+TWENTY_ONE_PLUS_THREE = {
+    "suited_trips": 100,
+    "straight_flush": 40,
+    "three_of_a_kind": 30,
+    "straight": 10,
+    "flush": 5,
+}
+
+# Rank indexes (Ace = 0) of every three card straight, Ace plays high or low
+STRAIGHTS = [(low, low + 1, low + 2) for low in range(11)] + [(11, 12, 0)]
+RED = (0, 1)
+BLACK = (2, 3)
+
+
+def falling(n: int, k: int) -> int:
+    return prod(range(n, n - k, -1))
+
+
+def by_suit(counts: Sequence[int]) -> list[Sequence[int]]:
+    return [counts[suit * 13 : suit * 13 + 13] for suit in range(4)]
+
+
+def insurance_odds(counts: Sequence[int]) -> dict[str, float]:
+    """Chance the dealer's hole card is a ten, given the unseen cards."""
+    total = sum(counts)
+    tens = sum(counts[suit * 13 + rank] for suit in range(4) for rank in range(9, 13))
+    return {"insurance": tens / total if total else 0.0}
+
+
+def perfect_pairs_odds(counts: Sequence[int]) -> dict[str, float]:
+    """Chances for the player's first two cards."""
+    total = falling(sum(counts), 2)
+    if not total:
+        return dict.fromkeys(PERFECT_PAIRS, 0.0)
+
+    suits = by_suit(counts)
+    perfect = sum(falling(count, 2) for count in counts)
+    colored = 0
+    mixed = 0
+    for rank in range(13):
+        red = [suits[suit][rank] for suit in RED]
+        black = [suits[suit][rank] for suit in BLACK]
+        colored += 2 * prod(red) + 2 * prod(black)
+        mixed += 2 * sum(red) * sum(black)
+
+    return {
+        "perfect_pair": perfect / total,
+        "colored_pair": colored / total,
+        "mixed_pair": mixed / total,
+    }
+
+
+def twenty_one_plus_three_odds(counts: Sequence[int]) -> dict[str, float]:
+    """Chances for the player's first two cards and the dealer's upcard."""
+    total = falling(sum(counts), 3)
+    if not total:
+        return dict.fromkeys(TWENTY_ONE_PLUS_THREE, 0.0)
+
+    suits = by_suit(counts)
+    ranks = [sum(suit[rank] for suit in suits) for rank in range(13)]
+
+    suited_trips = sum(falling(count, 3) for count in counts)
+    three_of_a_kind = sum(falling(count, 3) for count in ranks) - suited_trips
+
+    straight_flush = 0
+    straight = 0
+    for straight_ranks in STRAIGHTS:
+        suited = sum(prod(suit[rank] for rank in straight_ranks) for suit in suits)
+        straight_flush += 6 * suited
+        straight += 6 * (prod(ranks[rank] for rank in straight_ranks) - suited)
+
+    flush = sum(falling(sum(suit), 3) for suit in suits) - suited_trips - straight_flush
+
+    return {
+        "suited_trips": suited_trips / total,
+        "straight_flush": straight_flush / total,
+        "three_of_a_kind": three_of_a_kind / total,
+        "straight": straight / total,
+        "flush": flush / total,
+    }
+
+
+def expected_value(odds: dict[str, float], payouts: dict[str, int]) -> float:
+    """Expected return per unit bet."""
+    win = sum(odds.values())
+    return sum(odds[outcome] * payouts[outcome] for outcome in odds) - (1 - win)
+
+
+def side_bet_evs(counts: Sequence[int]) -> dict[str, float]:
+    return {
+        "Insurance": expected_value(insurance_odds(counts), INSURANCE),
+        "Perfect Pairs": expected_value(perfect_pairs_odds(counts), PERFECT_PAIRS),
+        "21+3": expected_value(
+            twenty_one_plus_three_odds(counts), TWENTY_ONE_PLUS_THREE
+        ),
+    }
+
+
+def perfect_pairs(cards: Sequence[Card]) -> str | None:
+    """Settles Perfect Pairs on the player's first two cards."""
+    card1, card2 = cards[:2]
+    if card1.rank != card2.rank:
+        return None
+    if card1.suit == card2.suit:
+        return "perfect_pair"
+    if (card1.suit.value - 1 in RED) == (card2.suit.value - 1 in RED):
+        return "colored_pair"
+    return "mixed_pair"
+
+
+def twenty_one_plus_three(cards: Sequence[Card], upcard: Card) -> str | None:
+    """Settles 21+3 on the player's first two cards and the dealer's upcard."""
+    hand = [*cards[:2], upcard]
+    ranks = sorted(card.rank.value - 1 for card in hand)
+    flush = len({card.suit for card in hand}) == 1
+    straight = tuple(ranks) in STRAIGHTS or ranks == [0, 11, 12]
+
+    if len(set(ranks)) == 1:
+        return "suited_trips" if flush else "three_of_a_kind"
+    if straight:
+        return "straight_flush" if flush else "straight"
+    if flush:
+        return "flush"
+    return None
+
+
+def settle(outcome: str | None, payouts: dict[str, int], bet: int) -> int:
+    """Amount returned for a side bet, including the stake when it wins."""
+    if outcome is None:
+        return 0
+    return bet * (payouts[outcome] + 1)
+
+
+def is_insurance_offered(upcard: Card) -> bool:
+    return upcard.rank == Rank.ACE
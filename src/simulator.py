@@ -0,0 +1,242 @@
+"""Batch simulator, run as `blackjack-sim` or `python src/simulator.py`.
+
+This module must stay importable without Textual so that it starts quickly
+in batch jobs.
+"""
+
+import argparse
+import csv
+import json
+import math
+import os
+import random
+import sys
+import time
+from array import array
+from dataclasses import dataclass, field
+from multiprocessing import Pool
+from typing import Iterator
+
+from card import MIN_RESERVE, PENETRATION, Shoot
+from engine import Engine, basic_strategy
+from enums import StrategyMove
+from settlement import CENTS, settle_bulk
+from shuffles import RNGS, SHUFFLES, make_rng
+from strategy import Strategy
+
+CHUNK_SIZE = 10000
+
+
+@dataclass
+class Tally:
+    rounds: int = 0
+    hands: int = 0
+    wagered: int = 0  # cents
+    net: int = 0  # cents
+    net_squared: int = 0  # cents², per round
+    moves: dict[str, int] = field(
+        default_factory=lambda: dict.fromkeys(StrategyMove.__members__, 0)
+    )
+
+    def add(self, other: "Tally") -> None:
+        self.rounds += other.rounds
+        self.hands += other.hands
+        self.wagered += other.wagered
+        self.net += other.net
+        self.net_squared += other.net_squared
+        for move, count in other.moves.items():
+            self.moves[move] += count
+
+
+@dataclass(frozen=True)
+class Chunk:
+    seed: int
+    decks: int
+    penetration: float
+    bet: int
+    rng: str = "mersenne"
+    shuffle: str = "uniform"
+    rounds: int = 0
+    shoes: int = 0
+
+
+def simulate(chunk: Chunk) -> Tally:
+    """Plays a fixed number of rounds, or whole shoes, from its own seed."""
+    seed = None if chunk.rng == "secrets" else chunk.seed
+    shoot = Shoot(
+        decks=chunk.decks,
+        penetration=chunk.penetration,
+        rng=make_rng(chunk.rng, seed),
+        shuffler=SHUFFLES[chunk.shuffle],
+    )
+    engine = Engine(shoot, basic_strategy(Strategy()))
+    tally = Tally()
+
+    # Outcomes are collected per hand and settled in one pass at the end
+    outcomes = array("B")
+    bets = array("q")
+    starts = array("q")
+
+    shoes = 0
+    while tally.rounds < chunk.rounds or shoes < chunk.shoes:
+        result = engine.play_round(chunk.bet)
+        starts.append(len(outcomes))
+        outcomes.extend(result.outcomes)
+        bets.extend(result.bets)
+        tally.rounds += 1
+        shoes += result.reshuffled
+
+    totals = settle_bulk(outcomes, bets, starts)
+    tally.hands = len(outcomes)
+    tally.wagered = totals.wagered
+    tally.net = totals.net
+    tally.net_squared = totals.net_squared
+
+    for move, count in engine.moves.items():
+        tally.moves[move.name] += count
+    return tally
+
+
+def chunks(args: argparse.Namespace, seed: int) -> Iterator[Chunk]:
+    common = dict(
+        decks=args.decks,
+        penetration=args.penetration,
+        bet=args.bet,
+        rng=args.rng,
+        shuffle=args.shuffle,
+    )
+    if args.shoes:
+        for idx in range(args.shoes):
+            yield Chunk(seed + idx, shoes=1, **common)
+        return
+
+    for idx, start in enumerate(range(0, args.hands, args.chunk_size)):
+        rounds = min(args.chunk_size, args.hands - start)
+        yield Chunk(seed + idx, rounds=rounds, **common)
+
+
+def report(tally: Tally, args: argparse.Namespace, seed: int, elapsed: float) -> dict:
+    unit = args.bet * CENTS
+    mean = tally.net / tally.rounds / unit if tally.rounds else 0.0
+    variance = (
+        tally.net_squared / tally.rounds / unit**2 - mean**2 if tally.rounds else 0
+    )
+    sd = math.sqrt(max(variance, 0.0))
+    moves = sum(tally.moves.values())
+
+    return {
+        "decks": args.decks,
+        "penetration": args.penetration,
+        "bet": args.bet,
+        "rng": args.rng,
+        "shuffle": args.shuffle,
+        "seed": seed,
+        "workers": args.workers,
+        "rounds": tally.rounds,
+        "hands": tally.hands,
+        "wagered": tally.wagered / CENTS,
+        "net": tally.net / CENTS,
+        "ev": mean,
+        "ev_per_wagered": tally.net / tally.wagered if tally.wagered else 0.0,
+        "sd": sd,
+        "se": sd / math.sqrt(tally.rounds) if tally.rounds else 0.0,
+        "seconds": elapsed,
+        "hands_per_second": tally.hands / elapsed if elapsed else 0.0,
+        "moves": {
+            move: count / moves if moves else 0.0 for move, count in tally.moves.items()
+        },
+    }
+
+
+def write_report(result: dict, args: argparse.Namespace) -> None:
+    output = open(args.output, "w", newline="") if args.output else sys.stdout
+    try:
+        if args.format == "json":
+            json.dump(result, output, indent=2)
+            output.write("\n")
+        else:
+            writer = csv.writer(output)
+            writer.writerow(["metric", "value"])
+            for key, value in result.items():
+                if key == "moves":
+                    for move, frequency in value.items():
+                        writer.writerow([f"move_{move.lower()}", frequency])
+                else:
+                    writer.writerow([key, value])
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="blackjack-sim",
+        description="Simulate basic strategy blackjack and report the results.",
+    )
+    amount = parser.add_mutually_exclusive_group()
+    amount.add_argument("--hands", type=int, default=100000, help="rounds to play")
+    amount.add_argument("--shoes", type=int, help="play whole shoes instead")
+    parser.add_argument("--decks", type=int, default=6, choices=range(1, 9))
+    parser.add_argument(
+        "--penetration",
+        type=float,
+        help=f"share of the shoot dealt before reshuffling, {PENETRATION} by "
+        f"default, or less to keep {MIN_RESERVE} cards behind the cut",
+    )
+    parser.add_argument("--bet", type=int, default=10, help="bet per round")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, help="seed for reproducible runs")
+    parser.add_argument(
+        "--rng", choices=RNGS, default="mersenne", help="random number generator"
+    )
+    parser.add_argument(
+        "--shuffle",
+        choices=list(SHUFFLES),
+        default="uniform",
+        help="how the shoot is shuffled",
+    )
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--format", choices=["json", "csv"])
+    parser.add_argument("--output", "-o", help="report file, stdout by default")
+    parser.add_argument("--quiet", "-q", action="store_true", help="hide progress")
+
+    args = parser.parse_args(argv)
+    if args.penetration is None:
+        args.penetration = PENETRATION
+    elif not 0 < args.penetration < 1:
+        parser.error("--penetration must be between 0 and 1")
+    elif int(args.decks * 52 * (1 - args.penetration)) < MIN_RESERVE:
+        parser.error(f"--penetration must leave at least {MIN_RESERVE} cards")
+    if args.format is None:
+        args.format = "csv" if (args.output or "").endswith(".csv") else "json"
+    return args
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    seed = args.seed if args.seed is not None else random.randrange(2**32)
+    work = list(chunks(args, seed))
+    tally = Tally()
+
+    start = time.perf_counter()
+    with Pool(args.workers) as pool:
+        for done, part in enumerate(pool.imap_unordered(simulate, work), start=1):
+            tally.add(part)
+            if not args.quiet:
+                elapsed = time.perf_counter() - start
+                print(
+                    f"\r{done}/{len(work)} chunks, {tally.rounds} rounds, "
+                    f"{tally.hands / elapsed:.0f} hands/s",
+                    end="",
+                    file=sys.stderr,
+                    flush=True,
+                )
+    elapsed = time.perf_counter() - start
+    if not args.quiet:
+        print(file=sys.stderr)
+
+    write_report(report(tally, args, seed, elapsed), args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""Compact integer encoding of a player hand, for use as a table key.
+
+A hand is reduced to what a decision can depend on: its best total, whether
+an ace is counted as 11, the value of a pair, how many cards it holds and
+whether it may still be doubled or split. Each of these is packed into a few
+bits of one int, so every reachable decision state has a small, canonical
+code that can key strategy tables, EV caches and statistics.
+"""
+
+from dataclasses import dataclass
+from functools import cache
+from typing import Iterable
+
+from card import Card
+
+TOTAL_BITS = 5
+PAIR_BITS = 4
+CARDS_BITS = 2
+
+SOFT_SHIFT = TOTAL_BITS
+PAIR_SHIFT = SOFT_SHIFT + 1
+CARDS_SHIFT = PAIR_SHIFT + PAIR_BITS
+DOUBLE_SHIFT = CARDS_SHIFT + CARDS_BITS
+SPLIT_SHIFT = DOUBLE_SHIFT + 1
+
+MAX_CARDS = 3  # Three or more cards are all treated alike
+
+# Dealer upcards by value, with the ace as 1, and their chart column labels.
+UPCARDS = range(1, 11)
+UPCARD_LABELS = ["", "A", *map(str, range(2, 11))]
+
+
+@dataclass(frozen=True)
+class PlayerState:
+    total: int  # Best total, counting an ace as 11 when that doesn't bust
+    soft: bool = False
+    pair: int = 0  # Value of both cards of a two card pair, 0 otherwise
+    cards: int = 2  # Number of cards, capped at MAX_CARDS
+    can_double: bool = False
+    can_split: bool = False
+
+    @property
+    def code(self) -> int:
+        return encode(
+            self.total,
+            self.soft,
+            self.pair,
+            self.cards,
+            self.can_double,
+            self.can_split,
+        )
+
+    @classmethod
+    def decode(cls, code: int) -> "PlayerState":
+        return cls(
+            total=code & (1 << TOTAL_BITS) - 1,
+            soft=bool(code >> SOFT_SHIFT & 1),
+            pair=code >> PAIR_SHIFT & (1 << PAIR_BITS) - 1,
+            cards=code >> CARDS_SHIFT & (1 << CARDS_BITS) - 1,
+            can_double=bool(code >> DOUBLE_SHIFT & 1),
+            can_split=bool(code >> SPLIT_SHIFT & 1),
+        )
+
+
+def encode(
+    total: int,
+    soft: bool = False,
+    pair: int = 0,
+    cards: int = 2,
+    can_double: bool = False,
+    can_split: bool = False,
+) -> int:
+    return (
+        total
+        | soft << SOFT_SHIFT
+        | pair << PAIR_SHIFT
+        | min(cards, MAX_CARDS) << CARDS_SHIFT
+        | (can_double and cards == 2) << DOUBLE_SHIFT
+        | (can_split and pair > 0) << SPLIT_SHIFT
+    )
+
+
+def encode_cards(
+    cards: list[Card], can_double: bool = False, can_split: bool = False
+) -> int:
+    total = 0
+    ace = False
+    for card in cards:
+        total += card.value
+        ace |= card.value == 1
+    soft = ace and total + 10 <= 21
+    if soft:
+        total += 10
+
+    pair = 0
+    if len(cards) == 2 and cards[0].value == cards[1].value:
+        pair = cards[0].value
+    return encode(total, soft, pair, len(cards), can_double, can_split)
+
+
+def next_state(code: int, value: int, can_split: bool = False) -> int | None:
+    """Code of the hand after it draws a card of `value`, or None if it busts.
+
+    The code is all that's needed: an ace only matters while the hand is soft,
+    and a single card hand's total is its card's value.
+    """
+    state = PlayerState.decode(code)
+    hard = state.total - 10 if state.soft else state.total
+    if hard + value > 21:
+        return None
+
+    pair = value if state.cards == 1 and hard == value else 0
+    hard += value
+    soft = (state.soft or value == 1) and hard + 10 <= 21
+    total = hard + 10 if soft else hard
+    return encode(total, soft, pair, state.cards + 1, can_split=can_split)
+
+
+@cache
+def all_states() -> tuple[int, ...]:
+    """Codes of every state a player can be asked to decide in, sorted.
+
+    Built by dealing every card value to every hand that hasn't reached 21,
+    starting from the single card left on each side of a split.
+    """
+    seen: set[tuple[int, bool, int, int]] = set()
+    frontier = [(value, value == 1, 0, 1) for value in UPCARDS]
+    while frontier:
+        hard, ace, pair, cards = frontier.pop()
+        if (hard, ace, pair, cards) in seen:
+            continue
+        seen.add((hard, ace, pair, cards))
+        total = hard + 10 if ace and hard + 10 <= 21 else hard
+        if total >= 21:
+            continue
+        for value in UPCARDS:
+            frontier.append(
+                (
+                    hard + value,
+                    ace or value == 1,
+                    value if cards == 1 and hard == value else 0,
+                    min(cards + 1, MAX_CARDS),
+                )
+            )
+
+    codes = set()
+    for hard, ace, pair, cards in seen:
+        soft = ace and hard + 10 <= 21
+        total = hard + 10 if soft else hard
+        if cards < 2 or total > 21:
+            continue
+        for can_double in _flags(cards == 2):
+            for can_split in _flags(pair > 0):
+                codes.add(encode(total, soft, pair, cards, can_double, can_split))
+    return tuple(sorted(codes))
+
+
+def _flags(possible: bool) -> Iterable[bool]:
+    return (False, True) if possible else (False,)
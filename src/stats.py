@@ -0,0 +1,89 @@
+from dataclasses import dataclass, field
+
+from enums import StrategyMove
+
+# Long run edge of basic strategy under the house rules, per unit wagered.
+EXPECTED_EDGE = -0.005
+
+
+@dataclass
+class Outcomes:
+    hands: int = 0
+    wins: int = 0
+    pushes: int = 0
+    losses: int = 0
+    wagered: int = 0  # cents
+    net: int = 0  # cents
+
+    def record(self, wagered: int, returned: int) -> None:
+        net = returned - wagered
+        self.hands += 1
+        self.wagered += wagered
+        self.net += net
+        if net > 0:
+            self.wins += 1
+        elif net == 0:
+            self.pushes += 1
+        else:
+            self.losses += 1
+
+    def rate(self, value: int) -> float:
+        return value / self.hands if self.hands else 0.0
+
+
+@dataclass
+class Stats:
+    """Running session aggregates, updated in O(1) per hand and decision."""
+
+    totals: Outcomes = field(default_factory=Outcomes)
+    by_count: dict[int, Outcomes] = field(default_factory=dict)
+    decisions: int = 0
+    adherent: int = 0
+
+    def record_hand(self, wagered: int, returned: int, count: int) -> None:
+        self.totals.record(wagered, returned)
+        if count not in self.by_count:
+            self.by_count[count] = Outcomes()
+        self.by_count[count].record(wagered, returned)
+
+    def record_decision(
+        self,
+        move: StrategyMove,
+        recommended: StrategyMove,
+        can_double: bool = True,
+        can_surrender: bool = True,
+    ) -> None:
+        self.decisions += 1
+        if is_adherent(move, recommended, can_double, can_surrender):
+            self.adherent += 1
+
+    @property
+    def adherence(self) -> float:
+        return self.adherent / self.decisions if self.decisions else 0.0
+
+    @property
+    def ev(self) -> float:
+        if not self.totals.wagered:
+            return 0.0
+        return self.totals.net / self.totals.wagered
+
+    @property
+    def expected_net(self) -> int:
+        return round(self.totals.wagered * EXPECTED_EDGE)
+
+
+def is_adherent(
+    move: StrategyMove,
+    recommended: StrategyMove,
+    can_double: bool = True,
+    can_surrender: bool = True,
+) -> bool:
+    match recommended:
+        case StrategyMove.DOUBLE if not can_double:
+            return move == StrategyMove.HIT
+        case StrategyMove.DOUBLE_ALLOWED:
+            return move == (StrategyMove.DOUBLE if can_double else StrategyMove.STAND)
+        case StrategyMove.SURRENDER if not can_surrender:
+            return move == StrategyMove.HIT
+        case _:
+            return move == recommended
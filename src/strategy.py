@@ -1,51 +1,113 @@
-from dataclasses import dataclass
-
-import pandas as pd
+import csv
+from dataclasses import dataclass, field
+from importlib import resources
 
 from enums import StrategyMove
 from hand import Hand
+from states import UPCARD_LABELS, UPCARDS, PlayerState, next_state
+
+DATA_PACKAGE = "blackjack_data"
+
+
+@dataclass
+class Chart:
+    """A strategy chart, with player hands as rows and dealer upcards as columns."""
+
+    columns: list[str]
+    cells: dict[str, dict[str, str]] = field(default_factory=dict)
+
+    @classmethod
+    def read(cls, name: str) -> "Chart":
+        """Reads a chart shipped in `DATA_PACKAGE`."""
+        path = resources.files(DATA_PACKAGE).joinpath(name)
+        with path.open(newline="", encoding="utf-8-sig") as file:
+            reader = csv.reader(file)
+            _, *columns = next(reader)
+            chart = cls(columns)
+            for hand, *moves in reader:
+                chart.cells[hand] = dict(zip(columns, moves))
+        return chart
+
+    @property
+    def index(self) -> list[str]:
+        return list(self.cells)
+
+    def loc(self, hand: str, dealer: str) -> str:
+        return self.cells[hand][dealer]
+
+    def rows(self) -> list[list[str]]:
+        return [[hand, *row.values()] for hand, row in self.cells.items()]
 
 
 class Strategy:
     def __init__(self) -> None:
-        self.hard_totals = pd.read_csv("src/data/hard_totals.csv").set_index("Hand")
-        self.soft_totals = pd.read_csv("src/data/soft_totals.csv").set_index("Hand")
-        self.splits = pd.read_csv("src/data/splits.csv").set_index("Hand")
+        self.hard_totals = Chart.read("hard_totals.csv")
+        self.soft_totals = Chart.read("soft_totals.csv")
+        self.splits = Chart.read("splits.csv")
+        # Filled in on first use, keyed by `states` code and upcard value
+        self.moves: dict[tuple[int, int], StrategyMove] = {}
+        self.next: dict[tuple[int, int, bool], tuple[StrategyMove | None, ...]] = {}
 
-    def get_strategy(self, player_hand: Hand, dealer_hand: Hand) -> StrategyMove:
-        dealer_card = dealer_hand.get_hand()
-        player_cards = player_hand.get_hand()
+    def get_strategy(
+        self, player_hand: Hand, dealer_hand: Hand, allow_split: bool = True
+    ) -> StrategyMove:
+        return self.get_move(
+            player_hand.get_state(can_split=allow_split), dealer_hand.cards[0].value
+        )
 
-        if player_cards == "A,10":
-            return StrategyMove.STAND
+    def get_move(self, state: int, upcard: int) -> StrategyMove:
+        key = (state, upcard)
+        move = self.moves.get(key)
+        if move is None:
+            move = self.moves[key] = self.decide(PlayerState.decode(state), upcard)
+        return move
 
-        cards = player_cards.split(",")
+    def next_moves(
+        self, state: int, upcard: int, can_split: bool = True
+    ) -> tuple[StrategyMove | None, ...]:
+        """The move after each card value the hand could draw, indexed by value - 1.
 
-        if dealer_card not in self.splits.columns:
-            return StrategyMove.STAND
+        None stands for a bust. `can_split` says whether a hand the next card
+        makes into a pair may be split.
+        """
+        key = (state, upcard, can_split)
+        moves = self.next.get(key)
+        if moves is None:
+            moves = self.next[key] = tuple(
+                None if drawn is None else self.get_move(drawn, upcard)
+                for drawn in (next_state(state, value, can_split) for value in UPCARDS)
+            )
+        return moves
 
-        _, total11 = player_hand.get_total()
+    def decide(self, state: PlayerState, upcard: int) -> StrategyMove:
+        dealer_card = UPCARD_LABELS[upcard]
+        total = state.total
 
-        if len(cards) == 2:
-            if cards[0] == cards[1]:
-                split_strategy = self.splits.loc[player_cards, dealer_card]
+        if state.cards == 2:
+            if state.soft and total == 21:
+                return StrategyMove.STAND
+            if state.pair and state.can_split:
+                pair = UPCARD_LABELS[state.pair]
+                split_strategy = self.splits.loc(f"{pair},{pair}", dealer_card)
                 if split_strategy == StrategyMove.SPLIT.value:
                     return StrategyMove.SPLIT
-            if cards[0] == "A":
-                soft_strategy = self.soft_totals.loc[player_cards, dealer_card]
+            if state.pair == 1:
+                return StrategyMove.HIT  # Soft 12, when the aces can't be split
+            if state.soft:
+                soft_strategy = self.soft_totals.loc(f"A,{total - 11}", dealer_card)
                 return StrategyMove(soft_strategy)
 
-            match [total11, dealer_card]:
+            match [total, dealer_card]:
                 case [16, "9" | "10" | "A"]:
                     return StrategyMove.SURRENDER
                 case [15, "10"]:
                     return StrategyMove.SURRENDER
 
-        if total11 >= 17:
-            hard_strategy = self.hard_totals.loc[">= 17", dealer_card]
-        elif total11 <= 8:
-            hard_strategy = self.hard_totals.loc["<= 8", dealer_card]
+        if total >= 17:
+            hard_strategy = self.hard_totals.loc(">= 17", dealer_card)
+        elif total <= 8:
+            hard_strategy = self.hard_totals.loc("<= 8", dealer_card)
         else:
-            hard_strategy = self.hard_totals.loc[str(total11), dealer_card]
+            hard_strategy = self.hard_totals.loc(str(total), dealer_card)
 
         return StrategyMove(hard_strategy)
@@ -0,0 +1,345 @@
+"""Strategy tournament, run as `blackjack-tournament` or `python src/tournament.py`.
+
+Every policy plays the very same shoes, so most of the luck of the deal
+cancels out of the differences between them (common random numbers). The
+shoes are shuffled once, up front, and shared read-only with the worker
+processes through shared memory.
+
+Like the simulator, this module must stay importable without Textual.
+"""
+
+import argparse
+import csv
+import importlib
+import json
+import math
+import os
+import random
+import statistics
+import sys
+import time
+from array import array
+from dataclasses import dataclass, field
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable, Iterator, Sequence
+
+from card import MIN_RESERVE, PENETRATION, Shoot
+from engine import (
+    Engine,
+    Policy,
+    basic_strategy,
+    count_deviations,
+    mimic_dealer,
+    never_bust,
+)
+from settlement import stake
+from shuffles import RNGS, SHUFFLES, Rng, Shuffler, make_rng
+from strategy import Strategy
+
+CHUNK_SIZE = 50  # shoes per task
+Z_95 = 1.959964
+
+POLICIES: dict[str, Callable[[Strategy], Policy]] = {
+    "basic": basic_strategy,
+    "count": count_deviations,
+    "never-bust": lambda strategy: never_bust,
+    "mimic-dealer": lambda strategy: mimic_dealer,
+}
+
+
+def load_policy(spec: str | Policy, strategy: Strategy) -> Policy:
+    """A policy from its name, a `module:function` path, or the callable itself."""
+    if callable(spec):
+        return spec
+    if spec in POLICIES:
+        return POLICIES[spec](strategy)
+
+    module, _, name = spec.partition(":")
+    if not name:
+        raise ValueError(
+            f"Unknown policy {spec!r}, expected one of {', '.join(POLICIES)} "
+            "or module:function"
+        )
+    return getattr(importlib.import_module(module), name)
+
+
+def policy_name(spec: str | Policy) -> str:
+    return spec if isinstance(spec, str) else spec.__name__
+
+
+def deal_shoes(
+    shoes: SharedMemory, count: int, decks: int, rng: Rng, shuffler: Shuffler
+) -> None:
+    """Writes `count` shuffled shoes of `Card.index` bytes into shared memory.
+
+    Each shoe is shuffled from the order of the one before, so imperfect
+    shuffles carry some of it over, as they do at a real table.
+    """
+    order = list(range(52)) * decks
+    size = len(order)
+    for idx in range(count):
+        order = shuffler(order, rng)
+        shoes.buf[idx * size : (idx + 1) * size] = bytes(order)
+
+
+@dataclass
+class Results:
+    """One policy's results, with the net of every shoe it played."""
+
+    nets: array = field(default_factory=lambda: array("q"))  # cents, per shoe
+    rounds: int = 0
+    hands: int = 0
+    wagered: int = 0  # cents
+
+
+@dataclass
+class Table:
+    """The state each worker process keeps between tasks."""
+
+    shoes: SharedMemory
+    shoe_size: int
+    bet: int
+    engines: list[Engine]
+
+
+_table: Table | None = None
+
+
+def init_worker(
+    name: str,
+    decks: int,
+    penetration: float,
+    bet: int,
+    specs: Sequence[str | Policy],
+) -> None:
+    global _table
+    strategy = Strategy()
+    engines = [
+        Engine(Shoot(decks, penetration=penetration), load_policy(spec, strategy))
+        for spec in specs
+    ]
+    _table = Table(SharedMemory(name=name), decks * 52, bet, engines)
+
+
+def play_shoes(span: tuple[int, int]) -> tuple[int, list[Results]]:
+    """Plays shoes `start` to `stop` with every policy, from the shared shoes."""
+    start, stop = span
+    table = _table
+    assert table is not None, "init_worker must run first"
+
+    results = []
+    for engine in table.engines:
+        result = Results()
+        for idx in range(start, stop):
+            engine.shoot.load(
+                table.shoes.buf[idx * table.shoe_size : (idx + 1) * table.shoe_size]
+            )
+            net = 0
+            while True:
+                # The next shared shoe replaces this one, so it isn't reshuffled
+                round_result = engine.play_round(table.bet, reshuffle=False)
+                net += round_result.net
+                result.rounds += 1
+                result.hands += round_result.hands
+                result.wagered += round_result.wagered
+                if round_result.reshuffled:
+                    break
+            result.nets.append(net)
+        results.append(result)
+    return start, results
+
+
+def spans(shoes: int, chunk_size: int) -> Iterator[tuple[int, int]]:
+    for start in range(0, shoes, chunk_size):
+        yield start, min(start + chunk_size, shoes)
+
+
+def run_tournament(
+    specs: Sequence[str | Policy],
+    shoes: int,
+    decks: int = 6,
+    penetration: float = PENETRATION,
+    bet: int = 10,
+    seed: int = 0,
+    rng: str = "mersenne",
+    shuffle: str = "uniform",
+    workers: int = 1,
+    chunk_size: int = CHUNK_SIZE,
+    progress: Callable[[int, int], None] | None = None,
+) -> list[Results]:
+    """Plays `shoes` shared shoes with every policy, in the order given."""
+    results = [Results(nets=array("q", bytes(8 * shoes))) for _ in specs]
+    work = list(spans(shoes, chunk_size))
+
+    shared = SharedMemory(create=True, size=shoes * decks * 52)
+    try:
+        rng_seed = None if rng == "secrets" else seed
+        deal_shoes(shared, shoes, decks, make_rng(rng, rng_seed), SHUFFLES[shuffle])
+        initargs = (shared.name, decks, penetration, bet, specs)
+        with Pool(workers, init_worker, initargs) as pool:
+            for done, (start, parts) in enumerate(
+                pool.imap_unordered(play_shoes, work), start=1
+            ):
+                for total, part in zip(results, parts):
+                    total.nets[start : start + len(part.nets)] = part.nets
+                    total.rounds += part.rounds
+                    total.hands += part.hands
+                    total.wagered += part.wagered
+                if progress:
+                    progress(done, len(work))
+    finally:
+        shared.close()
+        shared.unlink()
+    return results
+
+
+def report(
+    specs: Sequence[str | Policy], results: list[Results], bet: int
+) -> list[dict]:
+    """EV of every policy, and its paired difference from the first one.
+
+    The difference is the mean over shoes of the policy's net minus the first
+    policy's net on the same shoe, in units of the bet. `independent_ci` is
+    the half width the interval would have had without shared shoes.
+    """
+    unit = stake(bet)
+    baseline = results[0].nets
+    rows = []
+    for spec, result in zip(specs, results):
+        shoes = len(result.nets)
+        diffs = [(net - base) / unit for net, base in zip(result.nets, baseline)]
+        paired = Z_95 * statistics.stdev(diffs) / math.sqrt(shoes)
+        independent = Z_95 * math.sqrt(
+            (statistics.variance(result.nets) + statistics.variance(baseline)) / shoes
+        )
+        diff = statistics.fmean(diffs)
+        rows.append(
+            {
+                "policy": policy_name(spec),
+                "shoes": shoes,
+                "rounds": result.rounds,
+                "hands": result.hands,
+                "ev": sum(result.nets) / result.rounds / unit,
+                "ev_per_wagered": sum(result.nets) / result.wagered,
+                "net_per_shoe": sum(result.nets) / shoes / unit,
+                "diff_per_shoe": diff,
+                "ci_low": diff - paired,
+                "ci_high": diff + paired,
+                "independent_ci": independent / unit,
+            }
+        )
+    return rows
+
+
+def write_report(result: dict, args: argparse.Namespace) -> None:
+    output = open(args.output, "w", newline="") if args.output else sys.stdout
+    try:
+        if args.format == "json":
+            json.dump(result, output, indent=2)
+            output.write("\n")
+        else:
+            writer = csv.DictWriter(output, fieldnames=list(result["policies"][0]))
+            writer.writeheader()
+            writer.writerows(result["policies"])
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="blackjack-tournament",
+        description="Play several strategies on the same shoes and compare them.",
+    )
+    parser.add_argument(
+        "--policy",
+        "-p",
+        action="append",
+        dest="policies",
+        help=f"{', '.join(POLICIES)} or module:function, repeat for each policy. "
+        "The first one is the baseline the others are compared to",
+    )
+    parser.add_argument("--shoes", type=int, default=2000, help="shoes to play")
+    parser.add_argument("--decks", type=int, default=6, choices=range(1, 9))
+    parser.add_argument(
+        "--penetration",
+        type=float,
+        help=f"share of each shoe dealt before it ends, {PENETRATION} by "
+        f"default, or less to keep {MIN_RESERVE} cards behind the cut",
+    )
+    parser.add_argument("--bet", type=int, default=10, help="bet per round")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, help="seed for reproducible shoes")
+    parser.add_argument(
+        "--rng", choices=RNGS, default="mersenne", help="random number generator"
+    )
+    parser.add_argument(
+        "--shuffle",
+        choices=list(SHUFFLES),
+        default="uniform",
+        help="how each shoe is shuffled from the last",
+    )
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--format", choices=["json", "csv"])
+    parser.add_argument("--output", "-o", help="report file, stdout by default")
+    parser.add_argument("--quiet", "-q", action="store_true", help="hide progress")
+
+    args = parser.parse_args(argv)
+    if args.policies is None:
+        args.policies = list(POLICIES)
+    if args.shoes < 2:
+        parser.error("--shoes must be at least 2")
+    if args.penetration is None:
+        args.penetration = PENETRATION
+    elif not 0 < args.penetration < 1:
+        parser.error("--penetration must be between 0 and 1")
+    elif int(args.decks * 52 * (1 - args.penetration)) < MIN_RESERVE:
+        parser.error(f"--penetration must leave at least {MIN_RESERVE} cards")
+    if args.format is None:
+        args.format = "csv" if (args.output or "").endswith(".csv") else "json"
+    return args
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    seed = args.seed if args.seed is not None else random.randrange(2**32)
+    start = time.perf_counter()
+
+    def progress(done: int, total: int) -> None:
+        if not args.quiet:
+            print(f"\r{done}/{total} chunks", end="", file=sys.stderr, flush=True)
+
+    results = run_tournament(
+        args.policies,
+        args.shoes,
+        decks=args.decks,
+        penetration=args.penetration,
+        bet=args.bet,
+        seed=seed,
+        rng=args.rng,
+        shuffle=args.shuffle,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        progress=progress,
+    )
+    if not args.quiet:
+        print(file=sys.stderr)
+
+    write_report(
+        {
+            "decks": args.decks,
+            "penetration": args.penetration,
+            "bet": args.bet,
+            "rng": args.rng,
+            "shuffle": args.shuffle,
+            "seed": seed,
+            "seconds": time.perf_counter() - start,
+            "policies": report(args.policies, results, args.bet),
+        },
+        args,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+import random
+from collections import deque
+from dataclasses import dataclass, field
+
+from rich.text import Text
+from textual import on
+from textual.app import ComposeResult
+from textual.containers import Horizontal
+from textual.widget import Widget
+from textual.widgets import Button, DataTable
+
+from card import Card
+from classes import SubTitle, TextContent
+from enums import Rank, StrategyMove, Suit
+from hand import Hand
+from stats import is_adherent
+from strategy import Strategy
+
+BATCH_SIZE = 32
+REFILL_AT = 8
+MISTAKE_WEIGHT = 8
+
+TEN_RANKS = [Rank.TEN, Rank.JACK, Rank.QUEEN, Rank.KING]
+
+# Two card, non-pair, ace-free ways of making each hard total row.
+HARD_TOTALS = {
+    ">= 17": [(7, 10), (8, 9), (8, 10), (9, 10)],
+    "<= 8": [(2, 3), (2, 4), (2, 5), (3, 4), (2, 6), (3, 5)],
+    **{
+        str(total): [
+            (low, total - low) for low in range(2, 11) if low < total - low <= 10
+        ]
+        for total in range(9, 17)
+    },
+}
+
+
+@dataclass(frozen=True)
+class Cell:
+    table: str
+    hand: str
+    dealer: str
+
+
+@dataclass
+class CellRecord:
+    attempts: int = 0
+    correct: int = 0
+
+    @property
+    def misses(self) -> int:
+        return self.attempts - self.correct
+
+    @property
+    def weight(self) -> float:
+        return 1 + MISTAKE_WEIGHT * self.misses / (self.attempts + 1)
+
+
+@dataclass
+class Drill:
+    cell: Cell
+    player_hand: Hand
+    dealer_hand: Hand
+    answer: StrategyMove
+    player_str: str = field(init=False)
+    dealer_str: str = field(init=False)
+
+    def __post_init__(self):
+        self.player_str = str(self.player_hand)
+        self.dealer_str = str(self.dealer_hand)
+
+    def check(self, move: StrategyMove) -> bool:
+        return is_adherent(move, self.answer)
+
+
+def random_card(value: int) -> Card:
+    if value == 10:
+        rank = random.choice(TEN_RANKS)
+    else:
+        rank = Rank(value)
+    return Card(random.choice(list(Suit)), rank)
+
+
+def card_value(label: str) -> int:
+    return 1 if label == "A" else int(label)
+
+
+class DrillGenerator:
+    """Hands out random chart situations, favouring the ones answered wrong."""
+
+    def __init__(self, strategy: Strategy) -> None:
+        self.strategy = strategy
+        self.tables = {
+            "hard": strategy.hard_totals,
+            "soft": strategy.soft_totals,
+            "splits": strategy.splits,
+        }
+        self.records = {
+            Cell(name, str(hand), str(dealer)): CellRecord()
+            for name, table in self.tables.items()
+            for hand in table.index
+            for dealer in table.columns
+        }
+        self.queue: deque[Drill] = deque()
+        self.fill()
+
+    def fill(self) -> None:
+        cells = list(self.records)
+        weights = [record.weight for record in self.records.values()]
+        for cell in random.choices(cells, weights, k=BATCH_SIZE):
+            self.queue.append(self.make_drill(cell))
+
+    def make_drill(self, cell: Cell) -> Drill:
+        match cell.table:
+            case "hard":
+                values = random.choice(HARD_TOTALS[cell.hand])
+            case "soft":
+                values = (1, card_value(cell.hand.split(",")[1]))
+            case _:
+                values = (card_value(cell.hand.split(",")[0]),) * 2
+
+        player_hand = Hand(cards=[random_card(value) for value in values])
+        dealer_hand = Hand(
+            cards=[
+                random_card(card_value(cell.dealer)),
+                random_card(random.randint(1, 10)),
+            ],
+            dealer=True,
+        )
+        answer = self.strategy.get_strategy(player_hand, dealer_hand)
+        return Drill(cell, player_hand, dealer_hand, answer)
+
+    def next(self) -> Drill:
+        if len(self.queue) <= REFILL_AT:
+            self.fill()
+        return self.queue.popleft()
+
+    def answer(self, drill: Drill, move: StrategyMove) -> bool:
+        correct = drill.check(move)
+        record = self.records[drill.cell]
+        record.attempts += 1
+        record.correct += correct
+        return correct
+
+    @property
+    def accuracy(self) -> float:
+        attempts = sum(record.attempts for record in self.records.values())
+        correct = sum(record.correct for record in self.records.values())
+        return correct / attempts if attempts else 0.0
+
+
+def record_text(record: CellRecord) -> Text:
+    if not record.attempts:
+        return Text("-")
+    if record.correct == record.attempts:
+        style = "bold green"
+    elif record.correct * 2 >= record.attempts:
+        style = "bold yellow"
+    else:
+        style = "bold red"
+    return Text(f"{record.correct}/{record.attempts}", style=style)
+
+
+class TrainerDisplay(Widget):
+    MOVES = {
+        "drill_hit": StrategyMove.HIT,
+        "drill_stand": StrategyMove.STAND,
+        "drill_double": StrategyMove.DOUBLE,
+        "drill_split": StrategyMove.SPLIT,
+        "drill_surrender": StrategyMove.SURRENDER,
+    }
+
+    def __init__(self, strategy: Strategy, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.drills = DrillGenerator(strategy)
+        self.drill = self.drills.next()
+
+    def compose(self) -> ComposeResult:
+        yield SubTitle("Dealer")
+        yield SubTitle(self.drill.dealer_str, id="drill_dealer")
+        yield SubTitle("Player")
+        yield SubTitle(self.drill.player_str, id="drill_player")
+        yield Horizontal(
+            Button("Hit", id="drill_hit", variant="primary"),
+            Button("Stand", id="drill_stand", variant="warning"),
+            Button("Double", id="drill_double", variant="success"),
+            Button("Split", id="drill_split", variant="success"),
+            Button("Surrender", id="drill_surrender", variant="error"),
+            classes="buttons",
+        )
+        yield TextContent("", id="drill_feedback")
+        yield TextContent("", id="drill_accuracy")
+        for name in self.drills.tables:
+            yield TextContent(Text(f"{name.title()} Accuracy", style="bold"))
+            yield DataTable(id=f"drill_{name}")
+
+    def on_mount(self) -> None:
+        for name, chart in self.drills.tables.items():
+            table = self.query_one(f"#drill_{name}", expect_type=DataTable)
+            table.add_column("Hand", key="Hand")
+            for dealer in chart.columns:
+                table.add_column(str(dealer), key=str(dealer))
+            for hand in chart.index:
+                table.add_row(str(hand), *["-"] * len(chart.columns), key=str(hand))
+
+    def play(self, action: str) -> None:
+        """Answers the drill with one of the game's moves, as its keys do."""
+        if f"drill_{action}" in self.MOVES:
+            self.query_one(f"#drill_{action}", Button).press()
+
+    @on(Button.Pressed)
+    def answer(self, event: Button.Pressed) -> None:
+        event.stop()
+        move = self.MOVES[str(event.button.id)]
+        drill = self.drill
+
+        if self.drills.answer(drill, move):
+            feedback = Text(f"Correct! {drill.answer.name}", style="bold green")
+        else:
+            feedback = Text(
+                f"Incorrect, you picked {move.name}. "
+                f"The correct move was {drill.answer.name}.",
+                style="bold red",
+            )
+
+        cell = drill.cell
+        self.query_one(f"#drill_{cell.table}", expect_type=DataTable).update_cell(
+            cell.hand, cell.dealer, record_text(self.drills.records[cell])
+        )
+        self.query_one("#drill_feedback", expect_type=TextContent).update(
+            Text(f"{drill.player_str} vs {drill.dealer_str}: ") + feedback
+        )
+        self.query_one("#drill_accuracy", expect_type=TextContent).update(
+            f"Accuracy: {self.drills.accuracy:.1%}"
+        )
+
+        self.drill = self.drills.next()
+        self.query_one("#drill_dealer", expect_type=SubTitle).update(
+            self.drill.dealer_str
+        )
+        self.query_one("#drill_player", expect_type=SubTitle).update(
+            self.drill.player_str
+        )
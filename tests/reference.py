@@ -0,0 +1,170 @@
+"""Reference implementation of a single round, written straight from the rules.
+
+It deliberately shares no code with the app so that any engine, shoe or
+settlement change can be checked against it.
+"""
+
+import random
+from dataclasses import dataclass, field
+
+from card import Card
+
+HIT = "hit"
+STAND = "stand"
+DOUBLE = "double"
+SPLIT = "split"
+SURRENDER = "surrender"
+
+MAX_HANDS = 4
+
+MOVE_WEIGHTS = {HIT: 6, STAND: 6, DOUBLE: 2, SPLIT: 4, SURRENDER: 1}
+
+
+def value(card: Card) -> int:
+    return min(card.rank.value, 10)
+
+
+def total(cards: list[Card]) -> tuple[int, bool]:
+    """Best total and whether an ace is being counted as 11."""
+    hard = sum(value(card) for card in cards)
+    if any(value(card) == 1 for card in cards) and hard + 10 <= 21:
+        return hard + 10, True
+    return hard, False
+
+
+@dataclass
+class RefHand:
+    bet: int  # dollars
+    cards: list[Card] = field(default_factory=list)
+    split: bool = False
+    doubled: bool = False
+    surrendered: bool = False
+    done: bool = False
+    returned: int = 0  # cents
+
+    @property
+    def total(self) -> int:
+        return total(self.cards)[0]
+
+    @property
+    def blackjack(self) -> bool:
+        return not self.split and len(self.cards) == 2 and self.total == 21
+
+    @property
+    def split_aces(self) -> bool:
+        return self.split and value(self.cards[0]) == 1
+
+    @property
+    def pair(self) -> bool:
+        return len(self.cards) == 2 and value(self.cards[0]) == value(self.cards[1])
+
+    @property
+    def bust(self) -> bool:
+        return self.total > 21
+
+
+class Round:
+    """Plays one round from a list of cards that are drawn from the end."""
+
+    def __init__(self, cards: list[Card], bet: int, balance: int) -> None:
+        self.cards = list(cards)
+        self.balance = balance - bet * 100
+        self.hands = [RefHand(bet)]
+        self.dealer: list[Card] = []
+        self.idx = 0
+        self.done = False
+
+        for _ in range(2):
+            self.hands[0].cards.append(self.cards.pop())
+            self.dealer.append(self.cards.pop())
+
+        if total(self.dealer)[0] == 21:
+            self.finish()
+
+    @property
+    def hand(self) -> RefHand:
+        return self.hands[self.idx]
+
+    def legal_moves(self) -> list[str]:
+        hand = self.hand
+        if hand.blackjack or hand.split_aces or hand.total >= 21:
+            return [STAND]
+
+        moves = [HIT, STAND]
+        if len(hand.cards) == 2:
+            if not hand.split:
+                moves.append(SURRENDER)
+            if self.balance >= hand.bet * 100:
+                moves.append(DOUBLE)
+                if hand.pair and len(self.hands) < MAX_HANDS:
+                    moves.append(SPLIT)
+        return moves
+
+    def act(self, move: str) -> None:
+        assert move in self.legal_moves(), (move, self.legal_moves())
+        hand = self.hand
+        match move:
+            case "hit":
+                hand.cards.append(self.cards.pop())
+                if hand.bust:
+                    self.stand()
+            case "stand":
+                self.stand()
+            case "double":
+                self.balance -= hand.bet * 100
+                hand.bet *= 2
+                hand.doubled = True
+                hand.cards.append(self.cards.pop())
+                self.stand()
+            case "surrender":
+                hand.surrendered = True
+                self.stand()
+            case "split":
+                self.balance -= hand.bet * 100
+                hand.split = True
+                self.hands.append(
+                    RefHand(hand.bet, cards=[hand.cards.pop()], split=True)
+                )
+                hand.cards.append(self.cards.pop())
+                if hand.split_aces:
+                    self.stand()
+
+    def stand(self) -> None:
+        self.hand.done = True
+        if self.idx < len(self.hands) - 1:
+            self.idx += 1
+            if len(self.hand.cards) < 2:
+                self.hand.cards.append(self.cards.pop())
+            if self.hand.split_aces:
+                self.stand()
+        else:
+            self.finish()
+
+    def finish(self) -> None:
+        best, soft = total(self.dealer)
+        dealer_blackjack = len(self.dealer) == 2 and best == 21
+        while best < 17 or (best == 17 and soft):
+            self.dealer.append(self.cards.pop())
+            best, soft = total(self.dealer)
+
+        for hand in self.hands:
+            stake = hand.bet * 100
+            if hand.surrendered:
+                hand.returned = stake // 2
+            elif hand.blackjack:
+                hand.returned = stake if dealer_blackjack else stake * 5 // 2
+            elif hand.bust or dealer_blackjack:
+                hand.returned = 0
+            elif best > 21 or hand.total > best:
+                hand.returned = stake * 2
+            elif hand.total == best:
+                hand.returned = stake
+            else:
+                hand.returned = 0
+            self.balance += hand.returned
+
+        self.done = True
+
+
+def choose(rnd: random.Random, moves: list[str]) -> str:
+    return rnd.choices(moves, [MOVE_WEIGHTS[move] for move in moves])[0]
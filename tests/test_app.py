@@ -0,0 +1,289 @@
+import asyncio
+import os
+import random
+
+import pytest
+from textual.widgets import Button, DataTable, Input
+
+from app import BlackjackApp, LazyColumn
+from card import Card
+from classes import TextContent
+from enums import HandState, Rank, Suit
+from reference import Round, choose
+from settlement import stake
+from trainer import TrainerDisplay
+
+ROUNDS = int(os.environ.get("BLACKJACK_HARNESS_ROUNDS", "100"))
+BUY_IN = 10000
+
+
+async def start_game(pilot, decks: int) -> None:
+    app = pilot.app
+    app.query_one("#buy_in", Input).value = str(BUY_IN)
+    app.query_one("#num_decks", Input).value = str(decks)
+    app.query_one("#start_game", Button).press()
+    await pilot.pause()
+
+
+async def settle(pilot) -> None:
+    """Waits until every queued game action has been performed."""
+    await pilot.pause()
+    await pilot.app.actions.join()
+    await pilot.pause()
+
+
+async def press(pilot, button: str) -> None:
+    widget = pilot.app.query_one(f"#{button}", Button)
+    assert not widget.disabled, f"{button} should be enabled"
+    widget.press()
+    await settle(pilot)
+
+
+async def play_round(pilot, rnd: random.Random, bet: int) -> Round:
+    """Plays a round in the app and the reference with the same decisions."""
+    app = pilot.app
+    ref = Round(app.shoot.cards, bet, app.balance)
+
+    app.query_one("#bet", Input).value = str(bet)
+    await press(pilot, "deal")
+
+    while not ref.done:
+        move = choose(rnd, ref.legal_moves())
+        ref.act(move)
+        await press(pilot, move)
+
+    assert not app.query_one("#deal", Button).disabled
+    assert app.balance == ref.balance
+
+    hands = list(app.pool)
+    assert [hand.bet for hand in hands] == [hand.bet for hand in ref.hands]
+    assert [hand.cards for hand in hands] == [hand.cards for hand in ref.hands]
+    assert app.dealer_hand.cards == ref.dealer
+    return ref
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+@pytest.mark.parametrize("decks", [1, 6])
+def test_random_rounds_match_reference(decks):
+    async def scenario():
+        random.seed(decks)
+        rnd = random.Random(decks)
+        app = BlackjackApp()
+        async with app.run_test() as pilot:
+            await start_game(pilot, decks)
+            for _ in range(ROUNDS):
+                await play_round(pilot, rnd, rnd.choice([10, 20, 50]))
+
+    run(scenario())
+
+
+def stacked(*ranks: Rank) -> list[Card]:
+    """Cards in dealing order: player, dealer, player, dealer, then the rest."""
+    return [Card(Suit.SPADES, rank) for rank in reversed(ranks)]
+
+
+SCENARIOS = {
+    "dealer_blackjack": (
+        [Rank.TEN, Rank.ACE, Rank.NINE, Rank.KING],
+        [],
+        -1000,
+    ),
+    "push_blackjacks": (
+        [Rank.ACE, Rank.ACE, Rank.KING, Rank.QUEEN],
+        [],
+        0,
+    ),
+    "player_blackjack": (
+        [Rank.ACE, Rank.NINE, Rank.KING, Rank.SEVEN],
+        ["stand"],
+        1500,
+    ),
+    "surrender": (
+        [Rank.TEN, Rank.TEN, Rank.SIX, Rank.SEVEN],
+        ["surrender"],
+        -500,
+    ),
+    "double_win": (
+        [Rank.FIVE, Rank.SIX, Rank.SIX, Rank.TEN, Rank.KING, Rank.TEN],
+        ["double"],
+        2000,
+    ),
+    "split_twenty_one_is_not_blackjack": (
+        [Rank.TEN, Rank.NINE, Rank.TEN, Rank.TEN, Rank.ACE, Rank.NINE],
+        ["split", "stand", "stand"],
+        1000,
+    ),
+    "split_aces_with_ten": (
+        [Rank.ACE, Rank.NINE, Rank.ACE, Rank.TEN, Rank.KING, Rank.KING],
+        ["split"],
+        2000,
+    ),
+    "resplit_and_double_after_split": (
+        [Rank.EIGHT, Rank.NINE, Rank.EIGHT, Rank.EIGHT]
+        + [Rank.EIGHT, Rank.THREE, Rank.TEN, Rank.NINE, Rank.KING],
+        ["split", "split", "double", "stand", "stand"],
+        3000,
+    ),
+}
+
+
+@pytest.mark.parametrize("name", SCENARIOS)
+def test_scripted_rounds(name):
+    ranks, moves, net = SCENARIOS[name]
+
+    async def scenario():
+        app = BlackjackApp()
+        async with app.run_test() as pilot:
+            await start_game(pilot, 1)
+            filler = [Card(Suit.HEARTS, Rank.TWO)] * 20
+            app.shoot.cards = filler + stacked(*ranks)
+            ref = Round(app.shoot.cards, 10, app.balance)
+            for move in moves:
+                ref.act(move)
+            assert ref.done
+            assert ref.balance - BUY_IN * 100 == net
+
+            app.shoot.cards = filler + stacked(*ranks)
+            app.query_one("#bet", Input).value = "10"
+            await press(pilot, "deal")
+            for move in moves:
+                await press(pilot, move)
+            assert app.balance - BUY_IN * 100 == net
+            assert app.pool.hands[0].state != HandState.ACTIVE
+
+    run(scenario())
+
+
+def test_sections_are_built_after_the_first_frame():
+    async def scenario():
+        random.seed(0)  # A fixed deal, so the round below plays a single hand
+        app = BlackjackApp()
+        async with app.run_test() as pilot:
+            # Visiting a page waits for it to be built, if it isn't yet
+            await app.reveal(".location-strategy")
+            assert app.query_one("#hard-totals", DataTable)
+
+            # The other pages are built without being visited
+            await pilot.pause()
+            assert all(column.children for column in app.query(LazyColumn))
+            assert app.query_one(TrainerDisplay)
+            assert app.query_one("#hard-totals", DataTable).row_count == 10
+            assert app.query_one("#surrender_table", DataTable).row_count == 2
+
+            await start_game(pilot, 1)
+            await play_round(pilot, random.Random(0), 10)
+            await app.reveal(".location-stats")
+            await pilot.pause()
+            assert "Hands played: 1" in str(
+                app.query_one("#stats_summary", TextContent).renderable
+            )
+
+    run(scenario())
+
+
+def test_hand_displays_are_shown_when_taken():
+    async def scenario():
+        app = BlackjackApp()
+        async with app.run_test() as pilot:
+            assert not any(display.display for display in app.hand_displays)
+
+            await start_game(pilot, 1)
+            app.query_one("#bet", Input).value = "10"
+            await press(pilot, "deal")
+            assert [display.display for display in app.hand_displays] == [
+                True,
+                False,
+                False,
+                False,
+            ]
+
+    run(scenario())
+
+
+def test_keys_are_queued_and_played_in_order():
+    async def scenario():
+        app = BlackjackApp()
+        async with app.run_test() as pilot:
+            await start_game(pilot, 1)
+            filler = [Card(Suit.HEARTS, Rank.TWO)] * 20
+            ranks, _, net = SCENARIOS["resplit_and_double_after_split"]
+            app.shoot.cards = filler + stacked(*ranks)
+            app.query_one("#bet", Input).value = "10"
+
+            # Queued without waiting for the screen to catch up in between
+            for action in ["deal", "split", "split"]:
+                app.action_play(action)
+            await pilot.press("d", "s", "s")
+            await settle(pilot)
+
+            assert app.balance - BUY_IN * 100 == net
+            assert [hand.bet for hand in app.pool] == [20, 10, 10]
+
+    run(scenario())
+
+
+def test_keys_answer_the_trainer_while_it_is_on_screen():
+    async def scenario():
+        app = BlackjackApp()
+        async with app.run_test() as pilot:
+            await start_game(pilot, 1)
+            filler = [Card(Suit.HEARTS, Rank.TWO)] * 20
+            app.shoot.cards = filler + stacked(
+                Rank.FIVE, Rank.TEN, Rank.SIX, Rank.SEVEN, Rank.THREE
+            )
+            app.query_one("#bet", Input).value = "10"
+            await press(pilot, "deal")
+            hand = app.active_hand.hand
+
+            await app.reveal(".location-trainer")
+            await pilot.pause()
+            await pilot.press("h", "s")
+            await settle(pilot)
+            records = app.query_one(TrainerDisplay).drills.records.values()
+            assert sum(record.attempts for record in records) == 2
+            assert len(hand.cards) == 2
+
+            await app.reveal(".location-game")
+            await pilot.pause()
+            await pilot.press("h")
+            await settle(pilot)
+            assert len(hand.cards) == 3
+
+    run(scenario())
+
+
+def test_recommendations_follow_the_cards():
+    async def scenario():
+        app = BlackjackApp()
+        async with app.run_test() as pilot:
+            await start_game(pilot, 1)
+            filler = [Card(Suit.HEARTS, Rank.TWO)] * 20
+            app.shoot.cards = filler + stacked(
+                Rank.FIVE, Rank.TEN, Rank.SIX, Rank.SEVEN, Rank.THREE
+            )
+            app.query_one("#bet", Input).value = "10"
+
+            await press(pilot, "deal")
+            assert app.recommended_strategy == "DOUBLE"
+            upcoming = str(app.next_recommendations.renderable)
+            assert upcoming.startswith("Next card:  A H  2 H")
+            assert upcoming.endswith("9 S  10 S")
+
+            await press(pilot, "hit")
+            assert app.recommended_strategy == "HIT"
+            assert str(app.next_recommendations.renderable).endswith("10 BUST")
+
+            # A pair that can't be split, as the balance can't cover it
+            await press(pilot, "stand")
+            app.balance = stake(10)
+            app.shoot.cards = filler + stacked(
+                Rank.EIGHT, Rank.SIX, Rank.EIGHT, Rank.TEN
+            )
+            await press(pilot, "deal")
+            assert app.buttons["split"].disabled
+            assert app.recommended_strategy == "STAND"
+
+    run(scenario())
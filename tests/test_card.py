@@ -0,0 +1,47 @@
+import copy
+import pickle
+
+import pytest
+
+from card import DECK, Card, Shoot
+from enums import Rank, Suit
+from hand import Hand
+
+
+def test_cards_are_interned():
+    card = Card(Suit.HEARTS, Rank.QUEEN)
+    assert Card(Suit.HEARTS, Rank.QUEEN) is card
+    assert pickle.loads(pickle.dumps(card)) is card
+    assert copy.deepcopy([card])[0] is card
+    assert DECK[card.index] is card
+    assert str(card) == "[Q♥️]"
+
+    with pytest.raises(AttributeError):
+        card.rank = Rank.KING
+
+
+def test_shoot_reuses_cards():
+    shoot = Shoot(decks=2)
+    cards = shoot.cards
+    shoot.draw()
+    shoot.shuffle()
+    assert shoot.cards is cards
+    assert sorted(card.index for card in cards) == sorted(list(range(52)) * 2)
+    assert shoot.remaining == [2] * 52
+
+
+def test_shoot_keeps_a_reserve():
+    assert Shoot(decks=6).reshuffle == 46
+    assert Shoot(decks=2).reshuffle == Shoot(decks=1).reshuffle == 20
+
+
+def test_hand_render_follows_changes():
+    hand = Hand(cards=[Card(Suit.SPADES, Rank.ACE)], dealer=True)
+    hand.add_card(Card(Suit.CLUBS, Rank.NINE))
+    assert str(hand) == "[A♠️] [ ? ]"
+    hand.dealer = False
+    assert str(hand) == "[A♠️] [9♣️]"
+    hand.pop_card()
+    assert str(hand) == "[A♠️]"
+    hand.reset()
+    assert str(hand) == ""
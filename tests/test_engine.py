@@ -0,0 +1,131 @@
+import os
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import simulator
+from card import Card, Shoot
+from engine import Engine, Situation, count_deviations
+from enums import Rank, StrategyMove, Suit
+from hand import Hand
+from reference import DOUBLE, SPLIT, STAND, SURRENDER, Round, choose
+from strategy import Strategy
+
+ROUNDS = int(os.environ.get("BLACKJACK_ENGINE_ROUNDS", "5000"))
+BALANCE = 10**12
+
+MOVES = {
+    "hit": StrategyMove.HIT,
+    "stand": StrategyMove.STAND,
+    "double": StrategyMove.DOUBLE,
+    "split": StrategyMove.SPLIT,
+    "surrender": StrategyMove.SURRENDER,
+}
+
+
+def finish_forced(ref: Round) -> None:
+    """The engine stands by itself whenever standing is the only move."""
+    while not ref.done and ref.legal_moves() == [STAND]:
+        ref.act(STAND)
+
+
+@pytest.mark.parametrize("decks", [1, 2, 8])
+def test_engine_matches_reference(decks):
+    random.seed(decks)
+    rnd = random.Random(decks)
+    rounds: list[Round] = []
+
+    def policy(situation: Situation) -> StrategyMove:
+        ref = rounds[-1]
+        finish_forced(ref)
+        legal = ref.legal_moves()
+        assert situation.can_double == (DOUBLE in legal)
+        assert situation.can_split == (SPLIT in legal)
+        assert situation.can_surrender == (SURRENDER in legal)
+
+        move = choose(rnd, legal)
+        ref.act(move)
+        return MOVES[move]
+
+    engine = Engine(Shoot(decks=decks), policy)
+    for _ in range(ROUNDS):
+        if len(engine.shoot.cards) < 40:
+            engine.shoot.shuffle()  # The reference can't reshuffle mid-round
+        bet = rnd.choice([10, 20, 50])
+        rounds.append(Round(engine.shoot.cards, bet, BALANCE))
+        result = engine.play_round(bet)
+
+        ref = rounds[-1]
+        finish_forced(ref)
+        assert ref.done
+        assert result.net == ref.balance - BALANCE
+        assert [hand.cards for hand in engine.pool] == [
+            hand.cards for hand in ref.hands
+        ]
+        assert engine.dealer_hand.cards == ref.dealer
+
+
+def test_simulator_runs_without_textual(tmp_path: Path):
+    src = Path(__file__).parent.parent / "src"
+    report = tmp_path / "report.csv"
+    code = (
+        "import sys, simulator;"
+        f"simulator.main(['--hands', '2000', '--workers', '1', '--seed', '1',"
+        f" '-q', '-o', r'{report}']);"
+        "assert 'textual' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], cwd=src, check=True)
+
+    rows = dict(line.split(",", 1) for line in report.read_text().splitlines())
+    assert rows["rounds"] == "2000"
+    assert "move_surrender" in rows
+
+
+def test_simulator_keeps_a_reserve():
+    with pytest.raises(SystemExit):
+        simulator.parse_args(["--decks", "1", "--penetration", "0.85"])
+    assert simulator.parse_args(["--decks", "2"]).penetration == 0.85
+    assert simulator.parse_args(["--decks", "1", "--penetration", "0.6"]).decks == 1
+
+
+def test_count_deviations():
+    policy = count_deviations(Strategy())
+    shoot = Shoot(decks=1)
+
+    def move(player: list[Rank], upcard: Rank, count: int, **flags) -> StrategyMove:
+        shoot.count = count
+        hand = Hand(cards=[Card(Suit.HEARTS, rank) for rank in player])
+        dealer = Hand(cards=[Card(Suit.CLUBS, upcard)], dealer=True)
+        return policy(Situation(hand, dealer, shoot, **flags))
+
+    # Pairs basic strategy splits are split whatever the count
+    for player, upcard in [(Rank.EIGHT, Rank.TEN), (Rank.EIGHT, Rank.NINE)]:
+        for count in (-5, 0, 5):
+            assert move([player] * 2, upcard, count, can_split=True) == (
+                StrategyMove.SPLIT
+            )
+    assert move([Rank.SIX] * 2, Rank.FOUR, -5, can_split=True) == StrategyMove.SPLIT
+
+    # Without the split, they're played as hard totals
+    assert move([Rank.EIGHT] * 2, Rank.TEN, 0) == StrategyMove.STAND
+    assert move([Rank.EIGHT] * 2, Rank.TEN, -1) == StrategyMove.HIT
+    assert move([Rank.TEN, Rank.TWO], Rank.FOUR, -1) == StrategyMove.HIT
+    assert move([Rank.TEN, Rank.TWO], Rank.FOUR, 0) == StrategyMove.STAND
+
+    # Tens are split against a 6 only at a high count
+    assert move([Rank.TEN] * 2, Rank.SIX, 3, can_split=True) == StrategyMove.STAND
+    assert move([Rank.TEN] * 2, Rank.SIX, 4, can_split=True) == StrategyMove.SPLIT
+
+
+def test_finished_shoes_can_be_left_unshuffled():
+    engine = Engine(Shoot(decks=1), lambda situation: StrategyMove.STAND)
+    while not engine.play_round(10, reshuffle=False).reshuffled:
+        pass
+    assert len(engine.shoot.cards) <= engine.shoot.reshuffle
+    assert engine.shoot.dealt
+
+    assert engine.play_round(10).reshuffled
+    assert len(engine.shoot.cards) == 52
@@ -0,0 +1,52 @@
+import pytest
+
+from card import Card
+from enums import Rank, Suit
+from hand import Hand, HandPool
+from rules import TableRules
+
+
+def hand(*ranks: Rank, split: bool = False) -> Hand:
+    return Hand(cards=[Card(Suit.CLUBS, rank) for rank in ranks], split=split)
+
+
+def test_split_limit():
+    rules = TableRules(max_hands=3)
+    assert rules.can_split(hand(Rank.KING, Rank.TEN), 1)
+    assert rules.can_split(hand(Rank.EIGHT, Rank.EIGHT, split=True), 2)
+    assert not rules.can_split(hand(Rank.EIGHT, Rank.EIGHT, split=True), 3)
+    assert not rules.can_split(hand(Rank.EIGHT, Rank.NINE), 1)
+
+
+def test_split_aces():
+    aces = hand(Rank.ACE, Rank.ACE, split=True)
+    assert not TableRules().can_split(aces, 2)
+    assert not TableRules().can_hit(aces)
+    assert TableRules().must_stand(aces, 2)
+
+    lenient = TableRules(resplit_aces=True, hit_split_aces=True)
+    assert lenient.can_split(aces, 2)
+    assert lenient.can_hit(aces)
+    assert not lenient.must_stand(aces, 2)
+
+
+def test_double_and_surrender_after_split():
+    split = hand(Rank.FIVE, Rank.SIX, split=True)
+    assert TableRules().can_double(split)
+    assert not TableRules(double_after_split=False).can_double(split)
+    assert not TableRules().can_surrender(split)
+    assert TableRules().can_surrender(hand(Rank.FIVE, Rank.SIX))
+
+
+def test_hand_pool_is_bounded_and_reused():
+    pool = HandPool(2)
+    first = pool.take(10)
+    first.add_card(Card(Suit.HEARTS, Rank.TWO))
+    pool.take(10)
+    with pytest.raises(IndexError):
+        pool.take(10)
+
+    pool.reset()
+    assert pool.take(20) is first
+    assert first.cards == [] and first.bet == 20
+    assert list(pool) == [first]
@@ -0,0 +1,90 @@
+import random
+
+import pytest
+
+from card import Card
+from enums import HandState, Rank, Suit
+from hand import Hand
+from settlement import (
+    Outcome,
+    _settle_bulk_python,
+    format_cents,
+    outcome,
+    payout,
+    settle_bulk,
+)
+
+
+def hand(*ranks: Rank, state: HandState = HandState.STAND) -> Hand:
+    return Hand(cards=[Card(Suit.CLUBS, rank) for rank in ranks], state=state)
+
+
+@pytest.mark.parametrize(
+    "player, dealer, expected",
+    [
+        (
+            hand(Rank.ACE, Rank.KING, state=HandState.BLACKJACK),
+            hand(Rank.TEN, Rank.SEVEN),
+            Outcome.BLACKJACK,
+        ),
+        (
+            hand(Rank.ACE, Rank.KING, state=HandState.BLACKJACK),
+            hand(Rank.ACE, Rank.TEN, state=HandState.BLACKJACK),
+            Outcome.PUSH,
+        ),
+        (
+            hand(Rank.TEN, Rank.TEN),
+            hand(Rank.ACE, Rank.TEN, state=HandState.BLACKJACK),
+            Outcome.LOSS,
+        ),
+        (
+            hand(Rank.TEN, Rank.SIX, state=HandState.SURRENDER),
+            hand(Rank.TEN, Rank.SEVEN),
+            Outcome.SURRENDER,
+        ),
+        (
+            hand(Rank.TEN, Rank.SIX, Rank.NINE, state=HandState.BUST),
+            hand(Rank.TEN, Rank.SIX, Rank.NINE),
+            Outcome.LOSS,
+        ),
+        (hand(Rank.TEN, Rank.TWO), hand(Rank.TEN, Rank.SIX, Rank.NINE), Outcome.WIN),
+        (hand(Rank.ACE, Rank.SEVEN), hand(Rank.TEN, Rank.EIGHT), Outcome.PUSH),
+        (hand(Rank.TEN, Rank.NINE), hand(Rank.ACE, Rank.ACE, Rank.EIGHT), Outcome.LOSS),
+    ],
+)
+def test_outcome(player, dealer, expected):
+    assert outcome(player, dealer) == expected
+
+
+def test_payouts():
+    assert [payout(result, 10) for result in Outcome] == [0, 1000, 2000, 2500, 500]
+    assert format_cents(payout(Outcome.BLACKJACK, 15)) == "$37.50"
+    assert format_cents(-505) == "-$5.05"
+    assert Hand(cards=[], bet=15).get_bet() == "$15.00"
+
+
+def test_bulk_settlement_matches_single_hands():
+    rnd = random.Random(0)
+    outcomes, bets, starts = [], [], []
+    wagered = returned = net_squared = 0
+    for _ in range(1000):
+        starts.append(len(outcomes))
+        net = 0
+        for _ in range(rnd.choice([1, 1, 1, 2, 4])):
+            result, bet = rnd.choice(list(Outcome)), rnd.choice([10, 20, 25])
+            outcomes.append(result)
+            bets.append(bet)
+            wagered += bet * 100
+            returned += payout(result, bet)
+            net += payout(result, bet) - bet * 100
+        net_squared += net**2
+
+    for totals in [
+        settle_bulk(outcomes, bets, starts),
+        _settle_bulk_python(outcomes, bets, starts),
+    ]:
+        assert (totals.wagered, totals.returned, totals.net_squared) == (
+            wagered,
+            returned,
+            net_squared,
+        )
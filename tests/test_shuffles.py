@@ -0,0 +1,60 @@
+import pytest
+
+from card import Shoot
+from shuffles import RNGS, SHUFFLES, Riffle, Wash, make_rng
+
+STACK = list(range(52)) * 2
+
+
+def rising_sequences(cards: list[int]) -> int:
+    """How many increasing runs of consecutive values `cards` splits into."""
+    position = {card: idx for idx, card in enumerate(cards)}
+    return 1 + sum(
+        position[card + 1] < position[card] for card in range(len(cards) - 1)
+    )
+
+
+@pytest.mark.parametrize("name", SHUFFLES)
+def test_shuffles_keep_the_cards(name):
+    shuffled = SHUFFLES[name](STACK, make_rng("mersenne", 1))
+    assert sorted(shuffled) == sorted(STACK)
+
+
+@pytest.mark.parametrize("name", ["mersenne", "pcg64", "philox"])
+def test_seeded_rngs_repeat(name):
+    first = SHUFFLES["casino"](STACK, make_rng(name, 7))
+    assert SHUFFLES["casino"](STACK, make_rng(name, 7)) == first
+    assert SHUFFLES["casino"](STACK, make_rng(name, 8)) != first
+
+
+def test_unknown_or_seeded_secrets_rng():
+    assert "secrets" in RNGS
+    with pytest.raises(ValueError):
+        make_rng("secrets", 1)
+    with pytest.raises(ValueError):
+        make_rng("dice")
+
+
+def test_riffles():
+    cards = list(range(52))
+    perfect = Riffle(0)(cards, make_rng("mersenne", 0))
+    assert perfect in (
+        [*sum(zip(cards[:26], cards[26:]), ())],
+        [*sum(zip(cards[26:], cards[:26]), ())],
+    )
+    for seed in range(20):
+        assert rising_sequences(Riffle()(cards, make_rng("mersenne", seed))) <= 2
+    assert Wash(1)(cards, make_rng("mersenne", 0)) == cards
+
+
+def test_shoot_reshuffles_the_discards():
+    shoot = Shoot(decks=1, shuffler=lambda cards, rng: cards)
+    assert [card.index for card in shoot.cards] == list(range(52))
+    dealt = [shoot.draw().index for _ in range(10)]
+    shoot.shuffle()
+    assert [card.index for card in shoot.cards][:10] == dealt
+    assert shoot.dealt == [] and shoot.count == 0
+
+    first = Shoot(decks=6, rng=make_rng("pcg64", 3), shuffler=SHUFFLES["casino"])
+    second = Shoot(decks=6, rng=make_rng("pcg64", 3), shuffler=SHUFFLES["casino"])
+    assert first.cards == second.cards
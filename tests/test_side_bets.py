@@ -0,0 +1,87 @@
+from itertools import permutations
+
+import pytest
+
+from card import Card
+from enums import Rank, Suit
+from side_bets import (
+    INSURANCE,
+    PERFECT_PAIRS,
+    TWENTY_ONE_PLUS_THREE,
+    expected_value,
+    insurance_odds,
+    perfect_pairs,
+    perfect_pairs_odds,
+    twenty_one_plus_three,
+    twenty_one_plus_three_odds,
+)
+
+DECK = [Card(suit, rank) for suit in Suit for rank in Rank]
+
+
+def counts(cards: list[Card]) -> list[int]:
+    result = [0] * 52
+    for card in cards:
+        result[card.index] += 1
+    return result
+
+
+def brute_force(cards: list[Card], size: int, settle) -> dict[str, float]:
+    """Odds by dealing every ordered hand of `size` cards."""
+    hits: dict[str, int] = {}
+    total = 0
+    for hand in permutations(cards, size):
+        total += 1
+        outcome = settle(hand)
+        if outcome is not None:
+            hits[outcome] = hits.get(outcome, 0) + 1
+    return {outcome: hits.get(outcome, 0) / total for outcome in hits}
+
+
+# A full deck, and one where some cards (including a duplicate) are known
+SHOES = {
+    "deck": DECK,
+    "depleted": DECK[5:40] + [DECK[12], DECK[14]],
+}
+
+
+@pytest.mark.parametrize("shoe", SHOES)
+def test_perfect_pairs_odds(shoe):
+    cards = SHOES[shoe]
+    exact = perfect_pairs_odds(counts(cards))
+    expected = brute_force(cards, 2, perfect_pairs)
+    for outcome in PERFECT_PAIRS:
+        assert exact[outcome] == pytest.approx(expected.get(outcome, 0.0))
+
+
+@pytest.mark.parametrize("shoe", SHOES)
+def test_twenty_one_plus_three_odds(shoe):
+    cards = SHOES[shoe]
+    exact = twenty_one_plus_three_odds(counts(cards))
+    expected = brute_force(
+        cards, 3, lambda hand: twenty_one_plus_three(hand[:2], hand[2])
+    )
+    for outcome in TWENTY_ONE_PLUS_THREE:
+        assert exact[outcome] == pytest.approx(expected.get(outcome, 0.0))
+
+
+def test_insurance_ev():
+    # 16 tens in 51 unseen cards once the dealer shows an ace
+    shoe = counts([card for card in DECK if card != Card(Suit.SPADES, Rank.ACE)])
+    odds = insurance_odds(shoe)
+    assert odds["insurance"] == pytest.approx(16 / 51)
+    assert expected_value(odds, INSURANCE) == pytest.approx(3 * 16 / 51 - 1)
+
+
+def test_settlement():
+    ace, two, three = DECK[:3]
+    assert perfect_pairs([ace, Card(Suit.HEARTS, Rank.ACE)]) == "perfect_pair"
+    assert perfect_pairs([ace, Card(Suit.DIAMONDS, Rank.ACE)]) == "colored_pair"
+    assert perfect_pairs([ace, Card(Suit.SPADES, Rank.ACE)]) == "mixed_pair"
+    assert twenty_one_plus_three([ace, two], three) == "straight_flush"
+    assert (
+        twenty_one_plus_three(
+            [Card(Suit.CLUBS, Rank.QUEEN), Card(Suit.SPADES, Rank.KING)], ace
+        )
+        == "straight"
+    )
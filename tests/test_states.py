@@ -0,0 +1,69 @@
+from itertools import product
+
+from card import Card
+from enums import Rank, StrategyMove, Suit
+from hand import Hand
+from states import PlayerState, all_states, encode, next_state
+from strategy import Strategy
+
+VALUES = [Rank(value) for value in range(1, 11)]
+
+
+def hand(*ranks: Rank) -> Hand:
+    return Hand(cards=[Card(Suit.DIAMONDS, rank) for rank in ranks])
+
+
+def test_encoding_round_trips():
+    for code in all_states():
+        assert PlayerState.decode(code).code == code
+
+    state = PlayerState.decode(hand(Rank.ACE, Rank.SEVEN).get_state(True, True))
+    assert state == PlayerState(18, soft=True, can_double=True)
+    state = PlayerState.decode(hand(Rank.KING, Rank.TEN).get_state(True, True))
+    assert state == PlayerState(20, pair=10, can_double=True, can_split=True)
+    assert hand(Rank.ACE, Rank.ACE, Rank.KING).get_state() == encode(12, cards=3)
+
+
+def test_every_dealt_hand_is_enumerated():
+    states = set(all_states())
+    for size in range(2, 5):
+        for ranks in product(VALUES, repeat=size):
+            player = hand(*ranks)
+            if player.get_total()[1] <= 21:
+                assert player.get_state(True, True) in states, ranks
+
+
+def test_strategy_covers_every_state():
+    strategy = Strategy()
+    for code in all_states():
+        for upcard in range(1, 11):
+            assert isinstance(strategy.get_move(code, upcard), StrategyMove)
+
+    dealer = Hand(cards=[Card(Suit.CLUBS, Rank.SIX)], dealer=True)
+    assert strategy.get_strategy(hand(Rank.EIGHT, Rank.EIGHT), dealer) == (
+        StrategyMove.SPLIT
+    )
+    assert strategy.get_strategy(hand(Rank.EIGHT, Rank.EIGHT), dealer, False) == (
+        StrategyMove.STAND
+    )
+
+
+def test_next_states_follow_the_cards():
+    strategy = Strategy()
+    dealer = Hand(cards=[Card(Suit.CLUBS, Rank.TEN)], dealer=True)
+    for size in range(1, 4):
+        for ranks in product(VALUES, repeat=size):
+            player = hand(*ranks)
+            if player.get_total()[1] > 21:
+                continue
+            state = player.get_state(can_split=True)
+            moves = strategy.next_moves(state, 10)
+            for rank in VALUES:
+                drawn = hand(*ranks, rank)
+                expected = None
+                if drawn.get_total()[1] <= 21:
+                    expected = drawn.get_state(can_split=True)
+                assert next_state(state, rank.value, True) == expected, ranks
+                assert moves[rank.value - 1] == (
+                    expected and strategy.get_strategy(drawn, dealer)
+                )
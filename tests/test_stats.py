@@ -0,0 +1,39 @@
+from card import Card
+from enums import Rank, StrategyMove, Suit
+from hand import Hand
+from stats import Stats, is_adherent
+from strategy import Strategy
+
+HIT = StrategyMove.HIT
+STAND = StrategyMove.STAND
+DOUBLE = StrategyMove.DOUBLE
+SPLIT = StrategyMove.SPLIT
+SURRENDER = StrategyMove.SURRENDER
+
+
+def test_adherence_falls_back_when_a_move_is_unavailable():
+    assert is_adherent(DOUBLE, DOUBLE)
+    assert is_adherent(HIT, DOUBLE, can_double=False)
+    assert not is_adherent(STAND, DOUBLE, can_double=False)
+
+    assert is_adherent(DOUBLE, StrategyMove.DOUBLE_ALLOWED)
+    assert not is_adherent(HIT, StrategyMove.DOUBLE_ALLOWED)
+    assert is_adherent(STAND, StrategyMove.DOUBLE_ALLOWED, can_double=False)
+
+    assert is_adherent(SURRENDER, SURRENDER)
+    assert is_adherent(HIT, SURRENDER, can_surrender=False)
+    assert not is_adherent(STAND, SURRENDER, can_surrender=False)
+
+
+def test_unavailable_split_is_played_as_a_total():
+    strategy = Strategy()
+    eights = Hand(cards=[Card(Suit.HEARTS, Rank.EIGHT), Card(Suit.CLUBS, Rank.EIGHT)])
+    dealer = Hand(cards=[Card(Suit.SPADES, Rank.SIX)], dealer=True)
+    assert strategy.get_strategy(eights, dealer) == SPLIT
+
+    stats = Stats()
+    stats.record_decision(SPLIT, strategy.get_strategy(eights, dealer))
+    stats.record_decision(STAND, strategy.get_strategy(eights, dealer, False))
+    stats.record_decision(HIT, strategy.get_strategy(eights, dealer, False))
+    assert (stats.decisions, stats.adherent) == (3, 2)
+    assert stats.adherence == 2 / 3
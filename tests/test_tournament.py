@@ -0,0 +1,63 @@
+from multiprocessing.shared_memory import SharedMemory
+
+import pytest
+
+from engine import Situation
+from enums import StrategyMove
+from tournament import parse_args, report, run_tournament
+
+SHOES = 200
+
+
+def always_stand(situation: Situation) -> StrategyMove:
+    return StrategyMove.STAND
+
+
+class TrackedMemory(SharedMemory):
+    names: list[str] = []
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.names.append(self.name)
+
+
+def test_policies_play_the_same_shoes(monkeypatch):
+    monkeypatch.setattr("tournament.SharedMemory", TrackedMemory)
+    specs = ["basic", "basic", "never-bust", always_stand]
+    results = run_tournament(specs, SHOES, seed=1, workers=2, chunk_size=30)
+    rows = report(specs, results, 10)
+
+    assert results[0].nets == results[1].nets
+    assert rows[1]["diff_per_shoe"] == rows[1]["ci_low"] == rows[1]["ci_high"] == 0
+    assert [row["policy"] for row in rows][2:] == ["never-bust", "always_stand"]
+    for row in rows[2:]:
+        assert row["ci_high"] < 0
+        assert row["ci_high"] - row["ci_low"] < 2 * row["independent_ci"]
+
+    again = run_tournament(specs[2:], SHOES, seed=1, workers=1)
+    assert [result.nets for result in again] == [result.nets for result in results[2:]]
+
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(name=TrackedMemory.names[0])
+
+
+def test_penetration_must_leave_cards_behind_the_cut():
+    with pytest.raises(SystemExit):
+        parse_args(["--decks", "1", "--penetration", "0.85"])
+    assert parse_args(["--decks", "1"]).penetration == 0.85
+    assert parse_args(["--decks", "1", "--penetration", "0.5"]).policies == [
+        "basic",
+        "count",
+        "never-bust",
+        "mimic-dealer",
+    ]
+
+
+def test_shoes_follow_the_rng_and_shuffle():
+    def play(**options):
+        return run_tournament(["basic"], 20, seed=2, workers=1, **options)[0].nets
+
+    casino = play(rng="pcg64", shuffle="casino")
+    assert play(rng="pcg64", shuffle="casino") == casino
+    assert play() != casino
+    assert parse_args(["--rng", "philox", "--shuffle", "riffle"]).shuffle == "riffle"
@@ -0,0 +1,66 @@
+import random
+from collections import Counter
+
+from enums import StrategyMove
+from states import UPCARD_LABELS, PlayerState
+from strategy import Strategy
+from trainer import CellRecord, DrillGenerator
+
+
+def test_misses_raise_the_weight():
+    assert CellRecord().weight == CellRecord(attempts=4, correct=4).weight == 1
+    assert CellRecord(attempts=4, correct=2).weight > 1
+    assert (
+        CellRecord(attempts=4, correct=0).weight
+        > CellRecord(attempts=4, correct=2).weight
+    )
+
+
+def test_drills_belong_to_their_cell():
+    random.seed(0)
+    generator = DrillGenerator(Strategy())
+    for cell in generator.records:
+        drill = generator.make_drill(cell)
+        state = PlayerState.decode(drill.player_hand.get_state(can_split=True))
+        first, second = (card.value for card in drill.player_hand.cards)
+        assert UPCARD_LABELS[drill.dealer_hand.cards[0].value] == cell.dealer
+        assert drill.answer == generator.strategy.get_strategy(
+            drill.player_hand, drill.dealer_hand
+        )
+
+        match cell.table:
+            case "hard":
+                assert not state.soft and not state.pair
+                if cell.hand == ">= 17":
+                    assert state.total >= 17
+                elif cell.hand == "<= 8":
+                    assert state.total <= 8
+                else:
+                    assert state.total == int(cell.hand)
+            case "soft":
+                assert state.soft and not state.pair
+                assert cell.hand == f"A,{second}"
+            case "splits":
+                assert state.can_split
+                assert cell.hand == f"{UPCARD_LABELS[first]},{UPCARD_LABELS[first]}"
+
+
+def test_answers_are_recorded_and_missed_cells_come_up_more():
+    random.seed(1)
+    generator = DrillGenerator(Strategy())
+    drill = generator.next()
+    wrong = next(move for move in StrategyMove if not drill.check(move))
+
+    assert not generator.answer(drill, wrong)
+    assert generator.answer(drill, drill.answer)
+    record = generator.records[drill.cell]
+    assert (record.attempts, record.correct) == (2, 1)
+    for _ in range(4):
+        generator.answer(drill, wrong)
+
+    generator.queue.clear()
+    for _ in range(100):
+        generator.fill()
+    drawn = Counter(queued.cell for queued in generator.queue)
+    others = (len(generator.queue) - drawn[drill.cell]) / (len(generator.records) - 1)
+    assert drawn[drill.cell] > 4 * others